@@ -1,8 +1,12 @@
 # setup.py
 import os
-from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-BASE_DIR = Path(__file__).resolve().parent
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+# Per-entry progress lines are opt-in: ALPHATRADE_SETUP_VERBOSE=1
+VERBOSE = os.environ.get("ALPHATRADE_SETUP_VERBOSE") == "1"
 
 PROJECT_STRUCTURE = {
     "src": {
@@ -27,40 +31,99 @@ PROJECT_STRUCTURE = {
     "logs": [],
 }
 
+# Present on any checkout the scaffold has already been run against
+SENTINELS = ("src/__init__.py", "tests", "logs")
 
-def create_structure(base, structure):
-    for name, content in structure.items():
-        if name == "__files__":
-            for file in content:
-                path = base / file
-                if not path.exists():
-                    path.touch()
-                    print(f"[+] Created file: {path}")
-        elif name == "__touch__":
-            for file in content:
-                path = base / file
-                if not path.exists():
-                    path.touch()
-                    print(f"[+] Touched file: {path}")
-        elif isinstance(content, dict):
-            folder = base / name
-            folder.mkdir(parents=True, exist_ok=True)
-            print(f"[+] Ensured directory: {folder}")
-            create_structure(folder, content)
-        elif isinstance(content, list):
-            folder = base / name
-            folder.mkdir(parents=True, exist_ok=True)
+
+def _existing_names(folder):
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def _touch(path):
+    # Bare create: Path.touch() would also utime() an existing file
+    fd = os.open(path, os.O_CREAT | os.O_WRONLY, 0o644)
+    os.close(fd)
+
+
+def _flatten(structure, base=""):
+    # Relative (dirs, files) manifest, parents before children
+    dirs, files = [], []
+    stack = deque([(base, structure)])
+    while stack:
+        base, structure = stack.pop()
+        for name, content in structure.items():
+            if name == "__files__":
+                files.extend((os.path.join(base, file), "Created") for file in content)
+            elif name == "__touch__":
+                files.extend((os.path.join(base, file), "Touched") for file in content)
+            elif isinstance(content, dict):
+                folder = os.path.join(base, name)
+                dirs.append(folder)
+                stack.append((folder, content))
+            elif isinstance(content, list):
+                folder = os.path.join(base, name)
+                dirs.append(folder)
+                files.extend((os.path.join(folder, file), "Created") for file in content)
+    return tuple(dirs), tuple(files)
+
+
+# PROJECT_STRUCTURE is constant, so it is only interpreted once
+_DIRS, _FILES = _flatten(PROJECT_STRUCTURE)
+
+# Directories known to exist in this process
+_created = {BASE_DIR}
+
+
+def create_structure(base):
+    # Directories first so every file below has its parent in place;
+    # _DIRS lists parents before children, so a plain mkdir suffices
+    for d in _DIRS:
+        folder = os.path.join(base, d)
+        if folder in _created:
+            continue
+        try:
+            os.mkdir(folder)
+        except FileExistsError:
+            pass
+        _created.add(folder)
+        if VERBOSE:
             print(f"[+] Ensured directory: {folder}")
-            for file in content:
-                path = folder / file
-                if not path.exists():
-                    path.touch()
-                    print(f"[+] Created file: {path}")
+
+    listings = {}
+    missing = []
+    for f, label in _FILES:
+        path = os.path.join(base, f)
+        folder, file = os.path.split(path)
+        existing = listings.get(folder)
+        if existing is None:
+            existing = listings[folder] = _existing_names(folder)
+        if file not in existing:
+            existing.add(file)
+            missing.append((path, label))
+
+    if not missing:
+        return
+
+    # os.open releases the GIL, so creation latency overlaps across threads
+    with ThreadPoolExecutor(max_workers=min(32, len(missing))) as executor:
+        list(executor.map(_touch, [path for path, _ in missing]))
+
+    if VERBOSE:
+        for path, label in missing:
+            print(f"[+] {label} file: {path}")
 
 
 def main():
+    if all(os.path.exists(os.path.join(BASE_DIR, p)) for p in SENTINELS):
+        print("✅ Project structure already initialized.")
+        return
+
     print("🔧 Building Binance Trading Bot project structure...")
-    create_structure(BASE_DIR, PROJECT_STRUCTURE)
+    create_structure(BASE_DIR)
     print("✅ Project structure ready.")
 
 
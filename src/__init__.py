@@ -1,28 +1,23 @@
-# src/__init__.py
 """
 Binance Futures Trading Bot
 A professional CLI-based trading bot for Binance USDT-M Futures
 """
 
+from .utils.lazy import lazy_exports
+
 __version__ = "1.0.0"
 __author__ = "Your Name"
 
-# src/client/__init__.py
-"""
-Client package for Binance API integration
-"""
-
-# src/orders/__init__.py
-"""
-Order execution package
-"""
-
-# src/orders/advanced/__init__.py
-"""
-Advanced order types implementation
-"""
-
-# src/utils/__init__.py
-"""
-Utility functions and configuration
-"""
\ No newline at end of file
+# Public names resolved on first access so importing the package
+# does not pull in python-binance, rich or pydantic up front
+__all__, __getattr__ = lazy_exports(__name__, {
+    "BinanceFuturesClient": ".client.binance_client",
+    "TradingValidator": ".client.validator",
+    "MarketOrderManager": ".orders.market_orders",
+    "LimitOrderManager": ".orders.limit_orders",
+    "OCOOrderManager": ".orders.advanced.oco",
+    "GridTradingManager": ".orders.advanced.grid",
+    "TWAPOrderManager": ".orders.advanced.twap",
+    "config": ".utils.config",
+    "logger": ".utils.logger",
+})
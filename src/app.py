@@ -6,12 +6,18 @@ Professional dashboard for trading operations and monitoring
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
 import time
 import sys
 import os
+import threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -24,12 +30,48 @@ try:
     from orders.advanced.oco import OCOOrderManager
     from orders.advanced.grid import GridTradingManager
     from orders.advanced.twap import TWAPOrderManager
-    from utils.logger import logger
+    from utils.logger import logger, tail_lines
     from utils.config import config
 except ImportError as e:
     st.error(f"Import Error: {e}")
     st.stop()
 
+# Optional: server-side downsampling for long price histories
+try:
+    from plotly_resampler import FigureResampler
+    from plotly_resampler.aggregation import MinMaxLTTB
+except ImportError:
+    FigureResampler = None
+
+# Optional: faster JSON encoding for Plotly figures and strategy results
+try:
+    import orjson
+    import plotly.io as pio
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    orjson = None
+
+# Optional: server-side PNG rendering for the static dashboard chart
+try:
+    import kaleido
+except ImportError:
+    kaleido = None
+
+# Optional: browser-side timer that reruns the whole page
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:
+    st_autorefresh = None
+
+# Orders kept in the session's history; older entries are dropped
+ORDERS_HISTORY_SIZE = 500
+
+# Columns shown in the Market Orders "Recent Orders" table
+RECENT_ORDER_COLUMNS = ['ts_str', 'type', 'side', 'quantity', 'symbol', 'status']
+
+# Above this many bars the dashboard chart switches to a downsampled line
+MAX_CANDLES = 1000
+
 # Page configuration
 st.set_page_config(
     page_title="Binance Futures Trading Bot",
@@ -38,8 +80,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS. Only the header needs it; colours for everything else come
+# from the theme in .streamlit/config.toml so they never ride the websocket
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -48,64 +91,90 @@ st.markdown("""
         text-align: center;
         margin-bottom: 2rem;
     }
-    .metric-card {
-        background-color: #1e1e1e;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #f39c12;
-    }
-    .success-box {
-        background-color: #27ae60;
-        color: white;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-    }
-    .error-box {
-        background-color: #e74c3c;
-        color: white;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-    }
-    .warning-box {
-        background-color: #f39c12;
-        color: white;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER = _CSS + '<h1 class="main-header">🚀 Binance Futures Trading Bot</h1>'
 
 # Initialize session state
 if 'client' not in st.session_state:
     st.session_state.client = None
+if 'managers' not in st.session_state:
+    st.session_state.managers = {}
 if 'orders_history' not in st.session_state:
-    st.session_state.orders_history = []
+    st.session_state.orders_history = deque(maxlen=ORDERS_HISTORY_SIZE)
 if 'last_refresh' not in st.session_state:
     st.session_state.last_refresh = datetime.now()
+    st.session_state.last_refresh_str = st.session_state.last_refresh.strftime('%H:%M:%S')
+if 'static_chart' not in st.session_state:
+    st.session_state.static_chart = False
+
+# Order managers are built on first use, so a page only pays for its own
+_MANAGERS = {
+    'market': MarketOrderManager,
+    'limit': LimitOrderManager,
+    'oco': OCOOrderManager,
+    'grid': GridTradingManager,
+    'twap': TWAPOrderManager,
+}
+
+@st.cache_resource
+def _get_client():
+    """Binance client shared by every browser session"""
+    return BinanceFuturesClient()
 
 def init_trading_client():
     """Initialize trading client"""
     try:
         if st.session_state.client is None:
-            st.session_state.client = BinanceFuturesClient()
-            st.session_state.market_manager = MarketOrderManager()
-            st.session_state.limit_manager = LimitOrderManager()
-            st.session_state.oco_manager = OCOOrderManager()
-            st.session_state.grid_manager = GridTradingManager()
-            st.session_state.twap_manager = TWAPOrderManager()
+            st.session_state.client = _get_client()
         return True
     except Exception as e:
         st.error(f"Failed to initialize trading client: {str(e)}")
         return False
 
-def get_account_info():
-    """Get account information"""
+def get_manager(name):
+    """Get this session's order manager for name, creating it on first use"""
+    managers = st.session_state.managers
+    if name not in managers:
+        managers[name] = _MANAGERS[name](interactive=False, client=_get_client())
+    return managers[name]
+
+# Workers only fetch data; st.* output calls stay on the script thread
+@st.cache_resource
+def _get_executor():
+    """Shared thread pool for overlapping independent Binance REST calls"""
+    return ThreadPoolExecutor(max_workers=8)
+
+def _submit(fn, *args):
+    """Run fn on the shared pool with this rerun's script context attached"""
+    ctx = get_script_run_ctx()
+    
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args)
+    
+    return _get_executor().submit(run)
+
+# Account payloads are keyed on the client's identity so a reconnect
+# (new client object) never reads the previous client's cached data
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_account_info(client_id, _client):
+    """Fetch account information, cached for 5s per client"""
+    return _client.get_account_info()
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_positions(client_id, _client):
+    """Fetch open positions, cached for 5s per client"""
+    return _client.get_positions()
+
+def get_account_info(pending=None):
+    """Get account information, optionally from an already-submitted fetch"""
     try:
-        account_info = st.session_state.client.get_account_info()
-        return account_info
+        if pending is not None:
+            return pending.result()
+        client = st.session_state.client
+        return _fetch_account_info(id(client), client)
     except Exception as e:
         st.error(f"Error getting account info: {str(e)}")
         return None
@@ -113,39 +182,125 @@ def get_account_info():
 def get_positions():
     """Get open positions"""
     try:
-        positions = st.session_state.client.get_positions()
-        return positions
+        client = st.session_state.client
+        return _fetch_positions(id(client), client)
     except Exception as e:
         st.error(f"Error getting positions: {str(e)}")
         return []
 
-def get_market_data(symbol):
-    """Get market data for symbol"""
+@st.cache_data(ttl=3, show_spinner=False)
+def _fetch_current_price(symbol):
+    """Fetch the ticker price alone, cached for 3s per symbol"""
+    return st.session_state.client.get_current_price(symbol)
+
+def get_current_price(symbol):
+    """Get current price for order forms that don't need klines"""
     try:
-        current_price = st.session_state.client.get_current_price(symbol)
-        klines = st.session_state.client.get_klines(symbol, '1h', 24)
-        
-        # Process klines data
-        df = pd.DataFrame(klines, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = df[col].astype(float)
-        
-        return current_price, df
+        return _fetch_current_price(symbol)
+    except Exception as e:
+        st.error(f"Error getting current price: {str(e)}")
+        return None
+
+def _fetch_klines(symbol, interval, limit):
+    """Fetch klines as (open time in ms, OHLCV) int64/float64 arrays"""
+    klines = st.session_state.client.get_klines(symbol, interval, limit)
+    return klines[:, 0].astype(np.int64), np.ascontiguousarray(klines[:, 1:6])
+
+def _get_klines_arr(symbol, interval='1h', limit=24):
+    """Get klines arrays, kept in session state for the current 15s window"""
+    cache = st.session_state.setdefault('klines_cache', {})
+    key = (symbol, interval, limit)
+    window = int(time.time() // 15)
+    entry = cache.get(key)
+    if entry is None or entry[0] != window:
+        entry = cache[key] = (window, *_fetch_klines(symbol, interval, limit))
+    return entry[1], entry[2]
+
+def get_market_data(symbol, interval='1h', limit=24):
+    """Get current price and (timestamps, ohlcv) klines arrays for symbol"""
+    try:
+        price_future = _submit(_fetch_current_price, symbol)
+        klines = _get_klines_arr(symbol, interval, limit)
+        return price_future.result(), klines
     except Exception as e:
         st.error(f"Error getting market data: {str(e)}")
         return None, None
 
+def show_json(result):
+    """Render a (possibly large) result dict as JSON"""
+    if orjson is None:
+        st.json(result)
+        return
+    # Strategy results hold datetimes and int-keyed order maps
+    body = orjson.dumps(
+        result,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        default=str
+    )
+    st.code(body.decode(), language='json')
+
+def build_price_chart(symbol, klines):
+    """Build the dashboard price chart, downsampling long histories"""
+    timestamps, ohlcv = klines
+    x = timestamps.view('datetime64[ms]')
+    
+    if len(timestamps) > MAX_CANDLES:
+        # SVG candlesticks scale badly; draw closes as a WebGL line instead
+        if FigureResampler is not None:
+            fig = FigureResampler(
+                go.Figure(),
+                default_n_shown_samples=MAX_CANDLES,
+                default_downsampler=MinMaxLTTB()
+            )
+            fig.add_trace(
+                go.Scattergl(name=symbol, mode='lines'),
+                hf_x=x,
+                hf_y=ohlcv[:, 3]
+            )
+        else:
+            fig = go.Figure(go.Scattergl(
+                x=x,
+                y=ohlcv[:, 3],
+                mode='lines',
+                name=symbol
+            ))
+    else:
+        fig = go.Figure(go.Candlestick(
+            x=x,
+            open=ohlcv[:, 0],
+            high=ohlcv[:, 1],
+            low=ohlcv[:, 2],
+            close=ohlcv[:, 3],
+            name=symbol
+        ))
+    
+    fig.update_layout(
+        title=f"{symbol} Price Chart (24H)",
+        xaxis_title="Time",
+        yaxis_title="Price (USDT)",
+        height=400,
+        showlegend=False,
+        xaxis_rangeslider_visible=False,
+        uirevision=symbol
+    )
+    return fig
+
+@st.cache_resource(max_entries=32)
+def _cached_price_chart(symbol, data_key, _klines):
+    """Price chart figure keyed on symbol and the raw klines bytes"""
+    return build_price_chart(symbol, _klines)
+
+@st.cache_data(ttl=15, max_entries=32)
+def _price_chart_png(symbol, data_key, _klines):
+    """Price chart rendered to PNG by kaleido, keyed like _cached_price_chart"""
+    fig = _cached_price_chart(symbol, data_key, _klines)
+    return fig.to_image(format='png', engine='kaleido')
+
 def main():
     """Main application"""
     
-    # Header
-    st.markdown('<h1 class="main-header">🚀 Binance Futures Trading Bot</h1>', unsafe_allow_html=True)
+    # Header (styles and title in a single element)
+    st.markdown(_HEADER, unsafe_allow_html=True)
     
     # Initialize client
     if not init_trading_client():
@@ -158,18 +313,22 @@ def main():
         ["Dashboard", "Market Orders", "Limit Orders", "Advanced Orders", "Grid Trading", "TWAP Orders", "Settings"]
     )
     
-    # Auto-refresh toggle
-    auto_refresh = st.sidebar.checkbox("Auto-refresh (30s)", value=False)
-    if auto_refresh:
-        time.sleep(30)
-        st.rerun()
+    # Auto-refresh toggle: the timer runs in the browser, so the script
+    # thread stays free between refreshes. Without streamlit-autorefresh
+    # only the dashboard's market fragment refreshes itself.
+    auto_refresh = st.sidebar.checkbox("Auto-refresh (30s)", value=False, key="auto_refresh")
+    if auto_refresh and st_autorefresh is not None:
+        st_autorefresh(interval=30_000, key="global_refresh")
     
-    # Manual refresh button
+    # Manual refresh button: the click already reruns the script, so
+    # dropping cached data is enough for this run to fetch fresh values
     if st.sidebar.button("🔄 Refresh Data"):
+        st.cache_data.clear()
+        st.session_state.pop('klines_cache', None)
         st.session_state.last_refresh = datetime.now()
-        st.rerun()
+        st.session_state.last_refresh_str = st.session_state.last_refresh.strftime('%H:%M:%S')
     
-    st.sidebar.markdown(f"*Last updated: {st.session_state.last_refresh.strftime('%H:%M:%S')}*")
+    st.sidebar.markdown(f"*Last updated: {st.session_state.last_refresh_str}*")
     
     # Page routing
     if page == "Dashboard":
@@ -191,33 +350,12 @@ def show_dashboard():
     """Dashboard page"""
     st.header("📊 Trading Dashboard")
     
-    # Account Overview
-    account_info = get_account_info()
-    if account_info:
-        col1, col2, col3, col4 = st.columns(4)
-        
-        # Find USDT balance
-        usdt_balance = 0
-        usdt_available = 0
-        total_pnl = 0
-        
-        for asset in account_info.get('assets', []):
-            if asset['asset'] == 'USDT':
-                usdt_balance = float(asset['walletBalance'])
-                usdt_available = float(asset['availableBalance'])
-                total_pnl = float(asset.get('unrealizedProfit', asset.get('unRealizedProfit', 0)))
-                break
-        
-        with col1:
-            st.metric("USDT Balance", f"${usdt_balance:,.2f}")
-        with col2:
-            st.metric("Available", f"${usdt_available:,.2f}")
-        with col3:
-            st.metric("Unrealized PnL", f"${total_pnl:+.2f}", 
-                     delta=f"{(total_pnl/usdt_balance*100):+.2f}%" if usdt_balance > 0 else "0%")
-        with col4:
-            margin_ratio = (usdt_balance - usdt_available) / usdt_balance * 100 if usdt_balance > 0 else 0
-            st.metric("Margin Used", f"{margin_ratio:.1f}%")
+    # Start the account fetch (its payload also carries the positions) so it
+    # runs while the market panel fetches klines; the overview is rendered
+    # into a container reserved above the chart once it resolves
+    client = st.session_state.client
+    account_future = _submit(_fetch_account_info, id(client), client)
+    overview = st.container()
     
     st.markdown("---")
     
@@ -226,58 +364,72 @@ def show_dashboard():
     
     with col1:
         st.subheader("📈 Market Chart")
-        symbol = st.selectbox("Select Symbol", ["BTCUSDT", "ETHUSDT", "BNBUSDT"], key="dashboard_symbol")
-        
-        current_price, price_data = get_market_data(symbol)
-        
-        if current_price and price_data is not None:
-            # Price chart
-            fig = go.Figure()
-            fig.add_trace(go.Candlestick(
-                x=price_data['timestamp'],
-                open=price_data['open'],
-                high=price_data['high'],
-                low=price_data['low'],
-                close=price_data['close'],
-                name=symbol
-            ))
-            
-            fig.update_layout(
-                title=f"{symbol} Price Chart (24H)",
-                xaxis_title="Time",
-                yaxis_title="Price (USDT)",
-                height=400,
-                showlegend=False
-            )
+        # Fallback timer when the whole page isn't being auto-refreshed
+        run_every = "30s" if st.session_state.get("auto_refresh") and st_autorefresh is None else None
+        st.fragment(run_every=run_every)(show_market_panel)()
+    
+    # Account Overview
+    account_info = get_account_info(account_future)
+    with overview:
+        if account_info:
+            # Find USDT balance
+            usdt_balance = 0
+            usdt_available = 0
+            total_pnl = 0
             
-            st.plotly_chart(fig, use_container_width=True)
+            for asset in account_info.get('assets', []):
+                if asset['asset'] == 'USDT':
+                    usdt_balance = float(asset['walletBalance'])
+                    usdt_available = float(asset['availableBalance'])
+                    total_pnl = float(asset.get('unrealizedProfit', asset.get('unRealizedProfit', 0)))
+                    break
             
-            # Current price
-            price_change = ((current_price - price_data['open'].iloc[0]) / price_data['open'].iloc[0]) * 100
-            st.metric(
-                f"{symbol} Current Price", 
-                f"${current_price:,.2f}", 
-                delta=f"{price_change:+.2f}%"
+            # Derive and format the whole row up front, then render it in one pass
+            if usdt_balance > 0:
+                pnl_pct = f"{total_pnl / usdt_balance * 100:+.2f}%"
+                margin_ratio = (usdt_balance - usdt_available) / usdt_balance * 100
+            else:
+                pnl_pct = "0%"
+                margin_ratio = 0
+            metrics = (
+                ("USDT Balance", f"${usdt_balance:,.2f}", None),
+                ("Available", f"${usdt_available:,.2f}", None),
+                ("Unrealized PnL", f"${total_pnl:+.2f}", pnl_pct),
+                ("Margin Used", f"{margin_ratio:.1f}%", None),
             )
+            for col, (label, value, delta) in zip(st.columns(4), metrics):
+                col.metric(label, value, delta=delta)
     
     with col2:
         st.subheader("💼 Open Positions")
-        positions = get_positions()
+        if account_info:
+            positions = [
+                pos for pos in account_info.get('positions', [])
+                if float(pos.get('positionAmt', 0)) != 0
+            ]
+        else:
+            positions = get_positions()
         
         if positions:
-            for pos in positions:
-                symbol = pos['symbol']
-                size = float(pos.get('positionAmt', 0))
-                pnl = float(pos.get('unrealizedProfit', pos.get('unRealizedProfit', 0)))
-                
-                pnl_color = "green" if pnl >= 0 else "red"
-                st.markdown(f"""
-                <div style="border: 1px solid #ddd; padding: 10px; margin: 5px 0; border-radius: 5px;">
-                    <strong>{symbol}</strong><br>
-                    Size: {size:.6f}<br>
-                    <span style="color: {pnl_color};">PnL: ${pnl:+.2f}</span>
-                </div>
-                """, unsafe_allow_html=True)
+            pos_df = pd.DataFrame([
+                {
+                    'Symbol': pos['symbol'],
+                    'Size': float(pos.get('positionAmt', 0)),
+                    'PnL': float(pos.get('unrealizedProfit', pos.get('unRealizedProfit', 0)))
+                }
+                for pos in positions
+            ])
+            # Styler display values take precedence over column_config,
+            # so the number formats live on the styler too
+            styled = pos_df.style.map(
+                lambda pnl: 'color: green' if pnl >= 0 else 'color: red',
+                subset=['PnL']
+            ).format({'Size': '{:.6f}', 'PnL': '${:+.2f}'})
+            st.dataframe(
+                styled,
+                hide_index=True,
+                use_container_width=True
+            )
         else:
             st.info("No open positions")
         
@@ -285,7 +437,7 @@ def show_dashboard():
         st.subheader("⚡ Quick Actions")
         if st.button("🛒 Quick Buy 0.001 BTC", use_container_width=True):
             try:
-                result = st.session_state.market_manager.execute_market_order("BTCUSDT", "BUY", 0.001)
+                result = get_manager('market').execute_market_order("BTCUSDT", "BUY", 0.001)
                 st.success("Order placed successfully!")
                 st.json(result)
             except Exception as e:
@@ -293,12 +445,39 @@ def show_dashboard():
         
         if st.button("💰 Quick Sell 0.001 BTC", use_container_width=True):
             try:
-                result = st.session_state.market_manager.execute_market_order("BTCUSDT", "SELL", 0.001)
+                result = get_manager('market').execute_market_order("BTCUSDT", "SELL", 0.001)
                 st.success("Order placed successfully!")
                 st.json(result)
             except Exception as e:
                 st.error(f"Order failed: {str(e)}")
 
+def show_market_panel():
+    """Dashboard market chart and current price"""
+    symbol = st.selectbox("Select Symbol", ["BTCUSDT", "ETHUSDT", "BNBUSDT"], key="dashboard_symbol")
+    
+    current_price, klines = get_market_data(symbol)
+    
+    if current_price and klines is not None and len(klines[0]):
+        timestamps, ohlcv = klines
+        
+        # Price chart, reused while the bars are unchanged
+        data_key = timestamps.tobytes() + ohlcv.tobytes()
+        if st.session_state.static_chart and kaleido is not None:
+            # Plain image: no client-side Plotly layout on each rerun
+            st.image(_price_chart_png(symbol, data_key, klines), use_column_width=True)
+        else:
+            fig = _cached_price_chart(symbol, data_key, klines)
+            st.plotly_chart(fig, use_container_width=True, theme=None)
+        
+        # Current price
+        open_24h = ohlcv[0, 0]
+        price_change = ((current_price - open_24h) / open_24h) * 100
+        st.metric(
+            f"{symbol} Current Price", 
+            f"${current_price:,.2f}", 
+            delta=f"{price_change:+.2f}%"
+        )
+
 def show_market_orders():
     """Market Orders page"""
     st.header("🛒 Market Orders")
@@ -314,7 +493,7 @@ def show_market_orders():
         quantity = st.number_input("Quantity", min_value=0.001, max_value=100.0, value=0.01, step=0.001, format="%.6f")
         
         # Show current price and estimated value
-        current_price, _ = get_market_data(symbol)
+        current_price = get_current_price(symbol)
         if current_price:
             estimated_value = quantity * current_price
             st.info(f"Current Price: ${current_price:,.2f}")
@@ -323,16 +502,16 @@ def show_market_orders():
         if st.button("Execute Market Order", type="primary", use_container_width=True):
             try:
                 with st.spinner("Placing order..."):
-                    # Override confirmation for web interface
-                    st.session_state.market_manager._confirm_order = lambda *args: True
-                    result = st.session_state.market_manager.execute_market_order(symbol, side, quantity)
+                    result = get_manager('market').execute_market_order(symbol, side, quantity)
                 
                 st.success("Market order executed successfully!")
                 st.json(result)
                 
-                # Add to history
+                # Add to history, formatting the time once on write
+                now = datetime.now()
                 st.session_state.orders_history.append({
-                    'timestamp': datetime.now(),
+                    'timestamp': now,
+                    'ts_str': now.strftime('%H:%M:%S'),
                     'type': 'MARKET',
                     'symbol': symbol,
                     'side': side,
@@ -351,14 +530,27 @@ def show_market_orders():
             st.metric("Current Price", f"${current_price:,.2f}")
             
             # Recent orders history
-            st.subheader("Recent Orders")
-            if st.session_state.orders_history:
-                recent_orders = st.session_state.orders_history[-5:]  # Last 5 orders
-                for order in reversed(recent_orders):
-                    st.write(f"**{order['type']}** {order['side']} {order['quantity']:.6f} {order['symbol']} - {order['status']}")
-                    st.caption(f"{order['timestamp'].strftime('%H:%M:%S')}")
-            else:
-                st.info("No recent orders")
+            show_recent_orders()
+
+@st.fragment
+def show_recent_orders():
+    """Last five orders placed this session, newest first"""
+    st.subheader("Recent Orders")
+    if st.session_state.orders_history:
+        # Last 5 orders, newest first, without copying the whole history
+        recent_orders = list(islice(reversed(st.session_state.orders_history), 5))
+        df = pd.DataFrame(recent_orders, columns=RECENT_ORDER_COLUMNS)
+        st.dataframe(
+            df,
+            column_config={
+                'ts_str': st.column_config.TextColumn("Time"),
+                'quantity': st.column_config.NumberColumn(format="%.6f")
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+    else:
+        st.info("No recent orders")
 
 def show_limit_orders():
     """Limit Orders page"""
@@ -375,7 +567,7 @@ def show_limit_orders():
         quantity = st.number_input("Quantity", min_value=0.001, max_value=100.0, value=0.01, step=0.001, format="%.6f")
         
         # Get current price for reference
-        current_price, _ = get_market_data(symbol)
+        current_price = get_current_price(symbol)
         if current_price:
             st.info(f"Current Market Price: ${current_price:,.2f}")
             
@@ -401,16 +593,16 @@ def show_limit_orders():
         if st.button("Place Limit Order", type="primary", use_container_width=True):
             try:
                 with st.spinner("Placing limit order..."):
-                    # Override confirmation for web interface
-                    st.session_state.limit_manager._confirm_limit_order = lambda *args: True
-                    result = st.session_state.limit_manager.execute_limit_order(symbol, side, quantity, price, wait_for_fill)
+                    result = get_manager('limit').execute_limit_order(symbol, side, quantity, price, wait_for_fill)
                 
                 st.success("Limit order placed successfully!")
                 st.json(result)
                 
-                # Add to history
+                # Add to history, formatting the time once on write
+                now = datetime.now()
                 st.session_state.orders_history.append({
-                    'timestamp': datetime.now(),
+                    'timestamp': now,
+                    'ts_str': now.strftime('%H:%M:%S'),
                     'type': 'LIMIT',
                     'symbol': symbol,
                     'side': side,
@@ -438,20 +630,28 @@ def show_limit_orders():
                 # Display as table
                 display_df = df[['symbol', 'side', 'origQty', 'price', 'status', 'time']].copy()
                 display_df.columns = ['Symbol', 'Side', 'Quantity', 'Price', 'Status', 'Time']
-                display_df['Price'] = display_df['Price'].astype(float).apply(lambda x: f"${x:,.2f}")
-                display_df['Quantity'] = display_df['Quantity'].astype(float).apply(lambda x: f"{x:.6f}")
+                display_df[['Quantity', 'Price']] = display_df[['Quantity', 'Price']].astype(float)
                 
-                st.dataframe(display_df, use_container_width=True)
+                # Numbers are formatted client-side by the column config
+                st.dataframe(
+                    display_df,
+                    column_config={
+                        'Price': st.column_config.NumberColumn(format="$%.2f"),
+                        'Quantity': st.column_config.NumberColumn(format="%.6f")
+                    },
+                    use_container_width=True
+                )
                 
                 # Cancel order section
                 st.subheader("Cancel Order")
-                order_ids = [str(order['orderId']) for order in open_orders]
-                selected_order = st.selectbox("Select Order to Cancel", order_ids)
+                id_to_symbol = {str(order['orderId']): order['symbol'] for order in open_orders}
+                st.session_state.open_orders_index = id_to_symbol
+                selected_order = st.selectbox("Select Order to Cancel", list(id_to_symbol))
                 
                 if st.button("Cancel Selected Order", type="secondary"):
                     try:
                         # Find the symbol for this order
-                        order_symbol = next(order['symbol'] for order in open_orders if str(order['orderId']) == selected_order)
+                        order_symbol = st.session_state.open_orders_index[selected_order]
                         result = st.session_state.client.cancel_order(order_symbol, int(selected_order))
                         st.success(f"Order {selected_order} cancelled successfully!")
                         st.rerun()
@@ -480,7 +680,7 @@ def show_advanced_orders():
             side = st.selectbox("Side", ["BUY", "SELL"], key="oco_side")
             quantity = st.number_input("Quantity", min_value=0.001, value=0.01, step=0.001, format="%.6f", key="oco_qty")
             
-            current_price, _ = get_market_data(symbol)
+            current_price = get_current_price(symbol)
             if current_price:
                 st.info(f"Current Price: ${current_price:,.2f}")
                 
@@ -502,15 +702,13 @@ def show_advanced_orders():
             if st.button("Place OCO Order", type="primary", use_container_width=True):
                 try:
                     with st.spinner("Placing OCO order..."):
-                        # Override confirmation
-                        st.session_state.oco_manager._confirm_oco_order = lambda *args: True
-                        result = st.session_state.oco_manager.execute_oco_order(
+                        result = get_manager('oco').execute_oco_order(
                             symbol, side, quantity, take_profit, stop_loss, 
                             stop_limit if stop_limit > 0 else None
                         )
                     
                     st.success("OCO order placed successfully!")
-                    st.json(result)
+                    show_json(result)
                     
                 except Exception as e:
                     st.error(f"OCO order failed: {str(e)}")
@@ -545,7 +743,7 @@ def show_grid_trading():
         
         symbol = st.selectbox("Symbol", ["BTCUSDT", "ETHUSDT", "BNBUSDT"], key="grid_symbol")
         
-        current_price, _ = get_market_data(symbol)
+        current_price = get_current_price(symbol)
         if current_price:
             st.info(f"Current Price: ${current_price:,.2f}")
             
@@ -580,14 +778,12 @@ def show_grid_trading():
         if st.button("Start Grid Strategy", type="primary", use_container_width=True, disabled=(lower_price >= upper_price)):
             try:
                 with st.spinner("Setting up grid strategy..."):
-                    # Override confirmation
-                    st.session_state.grid_manager._confirm_grid_strategy = lambda *args: True
-                    result = st.session_state.grid_manager.execute_grid_strategy(
+                    result = get_manager('grid').execute_grid_strategy(
                         symbol, quantity_per_grid, grid_count, lower_price, upper_price
                     )
                 
                 st.success("Grid strategy started successfully!")
-                st.json(result)
+                show_json(result)
                 
             except Exception as e:
                 st.error(f"Grid strategy failed: {str(e)}")
@@ -599,7 +795,7 @@ def show_grid_trading():
             st.rerun()
         
         try:
-            active_grids = st.session_state.grid_manager.list_active_grids()
+            active_grids = get_manager('grid').list_active_grids()
             
             if active_grids:
                 for grid_id, grid_data in active_grids.items():
@@ -610,12 +806,12 @@ def show_grid_trading():
                             st.write(f"**Levels:** {grid_data['grid_count']}")
                             st.write(f"**Status:** {grid_data['status']}")
                         with col_b:
-                            st.write(f"**Trades:** {len(grid_data['executed_trades'])}")
+                            st.write(f"**Trades:** {len(grid_data['trades']['level'])}")
                             st.write(f"**Profit:** ${grid_data['total_profit']:.2f}")
                         
                         if st.button(f"Stop Grid {grid_id}", key=f"stop_{grid_id}"):
                             try:
-                                st.session_state.grid_manager.stop_grid_strategy(grid_id)
+                                get_manager('grid').stop_grid_strategy(grid_id)
                                 st.success(f"Grid {grid_id} stopped!")
                                 st.rerun()
                             except Exception as e:
@@ -646,7 +842,7 @@ def show_twap_orders():
         num_chunks = duration_minutes // interval_minutes
         chunk_size = total_quantity / num_chunks if num_chunks > 0 else 0
         
-        current_price, _ = get_market_data(symbol)
+        current_price = get_current_price(symbol)
         estimated_value = total_quantity * current_price if current_price else 0
         
         st.info(f"""
@@ -663,15 +859,13 @@ def show_twap_orders():
         if st.button("Start TWAP Order", type="primary", use_container_width=True):
             try:
                 with st.spinner("Setting up TWAP order..."):
-                    # Override confirmation
-                    st.session_state.twap_manager._confirm_twap_order = lambda *args: True
-                    result = st.session_state.twap_manager.execute_twap_order(
+                    result = get_manager('twap').execute_twap_order(
                         symbol, side, total_quantity, duration_minutes, interval_minutes,
                         price_limit if price_limit > 0 else None
                     )
                 
                 st.success("TWAP order started successfully!")
-                st.json(result)
+                show_json(result)
                 
             except Exception as e:
                 st.error(f"TWAP order failed: {str(e)}")
@@ -683,7 +877,7 @@ def show_twap_orders():
             st.rerun()
         
         try:
-            active_twaps = st.session_state.twap_manager.list_active_twap_orders()
+            active_twaps = get_manager('twap').list_active_twap_orders()
             
             if active_twaps:
                 for twap_id, twap_data in active_twaps.items():
@@ -703,7 +897,7 @@ def show_twap_orders():
                         
                         if st.button(f"Cancel TWAP {twap_id}", key=f"cancel_{twap_id}"):
                             try:
-                                st.session_state.twap_manager.cancel_twap_order(twap_id)
+                                get_manager('twap').cancel_twap_order(twap_id)
                                 st.success(f"TWAP {twap_id} cancelled!")
                                 st.rerun()
                             except Exception as e:
@@ -738,6 +932,15 @@ def show_settings():
         
         if st.button("Update Risk Settings"):
             st.success("Risk settings updated!")
+        
+        # Display settings
+        st.subheader("Display")
+        st.session_state.static_chart = st.toggle(
+            "Static dashboard chart",
+            value=st.session_state.static_chart,
+            disabled=kaleido is None,
+            help="Render the dashboard chart as an image (faster, not interactive). Requires kaleido."
+        )
     
     with col2:
         st.subheader("System Status")
@@ -745,7 +948,8 @@ def show_settings():
         # Connection test
         if st.button("Test Connection"):
             try:
-                account_info = get_account_info()
+                # Bypass the account cache so this really hits the API
+                account_info = st.session_state.client.get_account_info()
                 if account_info:
                     st.success("✅ Connection successful!")
                     st.json({"status": "connected", "account_type": "futures"})
@@ -763,10 +967,8 @@ def show_settings():
         st.subheader("Recent Logs")
         if st.button("View Logs"):
             try:
-                with open("bot.log", "r") as f:
-                    logs = f.readlines()[-10:]  # Last 10 lines
-                    for log in logs:
-                        st.text(log.strip())
+                # Last 10 lines, read from the end of the file
+                st.text("\n".join(tail_lines(config.logging.log_file, 10)))
             except FileNotFoundError:
                 st.info("No log file found")
             except Exception as e:
@@ -0,0 +1,21 @@
+"""
+Client package for Binance API integration
+"""
+
+try:
+    from ..utils.lazy import lazy_exports
+except ImportError:
+    from utils.lazy import lazy_exports
+
+__all__, __getattr__ = lazy_exports(__name__, {
+    "BinanceFuturesClient": ".binance_client",
+    "AsyncBinanceFuturesClient": ".async_client",
+    "TradingValidator": ".validator",
+    "OrderRequest": ".validator",
+    "LimitOrderRequest": ".validator",
+    "StopOrderRequest": ".validator",
+    "OCOOrderRequest": ".validator",
+    "TWAPOrderRequest": ".validator",
+    "GridOrderRequest": ".validator",
+    "BatchOrderRequest": ".validator",
+})
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Binance Futures client on a shared httpx connection pool
+Covers the hot read/cancel calls so callers can fan out with asyncio.gather
+"""
+
+import asyncio
+import hashlib
+import hmac
+import importlib.util
+import time
+from typing import Dict, List, Optional, Any
+from urllib.parse import urlencode
+
+import httpx
+from binance.exceptions import BinanceAPIException
+
+# Optional: faster JSON decoding of API responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ..utils.config import config
+    from ..utils.logger import logger
+except ImportError:
+    from utils.config import config
+    from utils.logger import logger
+
+LIVE_BASE_URL = "https://fapi.binance.com"
+
+# HTTP/2 needs the optional h2 package; fall back to pooled HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+class AsyncBinanceFuturesClient:
+    """Async counterpart of BinanceFuturesClient for price, status and cancel calls"""
+    
+    def __init__(self, recv_window: int = 5000):
+        self.api_key = config.binance.api_key
+        # Keyed once; each signature copies the primed HMAC state
+        self._hmac = hmac.new(config.binance.api_secret.encode(), digestmod=hashlib.sha256)
+        self.recv_window = recv_window
+        
+        base_url = config.binance.base_url if config.binance.testnet else LIVE_BASE_URL
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0,
+            headers={"X-MBX-APIKEY": self.api_key}
+        )
+        
+        logger.info(f"Async Binance client initialized (Testnet: {config.binance.testnet})")
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the pooled connections"""
+        await self._http.aclose()
+    
+    def _sign(self, params: Dict[str, Any]) -> str:
+        """Timestamp and HMAC-SHA256 sign params, returning the query string"""
+        params = dict(params, timestamp=int(time.time() * 1000), recvWindow=self.recv_window)
+        query = urlencode(params)
+        mac = self._hmac.copy()
+        mac.update(query.encode())
+        signature = mac.hexdigest()
+        return f"{query}&signature={signature}"
+    
+    async def _request(self, method: str, path: str, params: Dict[str, Any],
+                       signed: bool = False) -> Any:
+        """Send a request and raise BinanceAPIException on error responses"""
+        if signed:
+            response = await self._http.request(method, f"{path}?{self._sign(params)}")
+        else:
+            response = await self._http.request(method, path, params=params)
+        
+        if not response.is_success:
+            raise BinanceAPIException(response, response.status_code, response.text)
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    async def get_current_price(self, symbol: str) -> float:
+        """Get current market price for symbol"""
+        try:
+            ticker = await self._request("GET", "/fapi/v1/ticker/price", {"symbol": symbol})
+            return float(ticker['price'])
+        except BinanceAPIException as e:
+            logger.log_error(e, f"async get_current_price for {symbol}")
+            raise
+    
+    async def get_order_status(self, symbol: str, order_id: int) -> Dict[str, Any]:
+        """Get order status"""
+        try:
+            return await self._request(
+                "GET", "/fapi/v1/order", {"symbol": symbol, "orderId": order_id}, signed=True
+            )
+        except BinanceAPIException as e:
+            logger.log_error(e, f"async get_order_status {order_id}")
+            raise
+    
+    async def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
+        """Cancel an existing order"""
+        try:
+            result = await self._request(
+                "DELETE", "/fapi/v1/order", {"symbol": symbol, "orderId": order_id}, signed=True
+            )
+            logger.info(f"Order {order_id} cancelled for {symbol}")
+            return result
+        except BinanceAPIException as e:
+            logger.log_error(e, f"async cancel_order {order_id} for {symbol}")
+            raise
+    
+    async def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get all open orders"""
+        params = {"symbol": symbol} if symbol else {}
+        try:
+            return await self._request("GET", "/fapi/v1/openOrders", params, signed=True)
+        except BinanceAPIException as e:
+            logger.log_error(e, "async get_open_orders")
+            raise
+    
+    async def get_order_statuses(self, orders: List[tuple]) -> List[Any]:
+        """Fetch the status of several (symbol, order_id) pairs concurrently.
+        
+        Results keep the input order; a failed lookup is returned as its exception.
+        """
+        return await asyncio.gather(
+            *(self.get_order_status(symbol, order_id) for symbol, order_id in orders),
+            return_exceptions=True
+        )
@@ -4,26 +4,87 @@ Binance API client for futures trading
 Handles authentication, order placement, and account management
 """
 
+import hashlib
+import hmac
 import time
+import threading
+from collections import namedtuple
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from binance import Client
-from binance.exceptions import BinanceAPIException, BinanceOrderException
+from decimal import Decimal
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Any, Union
+import numpy as np
+from binance import Client, ThreadedWebsocketManager
+from binance.exceptions import BinanceAPIException, BinanceOrderException, BinanceRequestException
 import requests
-import sys
-import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Add src to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+# Optional: faster JSON decoding of API responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     from ..utils.config import config
     from ..utils.logger import logger, log_execution_time
-    from .validator import validator
+    from .validator import validator, register_symbol_filters, ValidatedOrder
 except ImportError:
     from utils.config import config
     from utils.logger import logger, log_execution_time
-    from client.validator import validator
+    from client.validator import validator, register_symbol_filters, ValidatedOrder
+
+# Per-symbol trading metadata derived from exchange info
+SymbolMeta = namedtuple('SymbolMeta', 'price_precision quantity_precision min_notional')
+
+# Symbol info TTLs (seconds) per field class: trading status can change at
+# any time (halts, delistings); filters and precisions almost never do.
+# The futures exchangeInfo endpoint can't be filtered by symbol, so every
+# refresh downloads all symbols; status is kept for minutes, not seconds,
+# and a halted symbol is still rejected by the exchange on submission
+SYMBOL_INFO_TTLS = {'status': 5 * 60, 'filters': 6 * 60 * 60, 'precision': 6 * 60 * 60}
+
+# Row field getters for the account and position payloads
+_ASSET_FIELDS = itemgetter('asset', 'walletBalance', 'availableBalance')
+_POSITION_FIELDS = itemgetter('symbol', 'positionAmt', 'entryPrice')
+
+# How long one unfiltered open-orders fetch is reused (seconds)
+OPEN_ORDERS_TTL = 0.5
+
+# A streamed price older than this (seconds) is treated as stale and
+# get_current_price goes back to REST, e.g. when the socket silently stalls
+STREAM_PRICE_MAX_AGE = 5.0
+
+# Binance accepts at most this many orders per batchOrders request
+MAX_BATCH_ORDERS = 5
+# ...and at most this many order ids per batch cancel
+MAX_BATCH_CANCELS = 10
+
+def _handle_response_orjson(response: requests.Response) -> Any:
+    """python-binance's Client._handle_response, decoding with orjson"""
+    if not (200 <= response.status_code < 300):
+        raise BinanceAPIException(response, response.status_code, response.text)
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        raise BinanceRequestException('Invalid Response: %s' % response.text)
+
+def _primed_hmac_signature(api_secret: str) -> Callable[[str], str]:
+    """HMAC-SHA256 signer keyed once; each call copies the primed state
+    instead of re-running the key schedule"""
+    base = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+    
+    def sign(query_string: str) -> str:
+        mac = base.copy()
+        mac.update(query_string.encode('utf-8'))
+        return mac.hexdigest()
+    
+    return sign
+
+def _plain_number(value: float) -> str:
+    """Format a number for the batch payload without scientific notation"""
+    return format(Decimal(str(value)), 'f')
 
 class BinanceFuturesClient:
     """Enhanced Binance Futures API client"""
@@ -34,58 +95,243 @@ class BinanceFuturesClient:
             api_secret=config.binance.api_secret,
             testnet=config.binance.testnet
         )
+        self._configure_session(self.client.session)
+        if orjson is not None:
+            # Instance-level override; other Client instances are untouched
+            self.client._handle_response = _handle_response_orjson
+        if config.binance.api_secret:
+            # Same per-instance override for request signing
+            self.client._hmac_signature = _primed_hmac_signature(config.binance.api_secret)
+        
+        # Every response marks the connection as recently used
+        self._last_request_ts = time.monotonic()
+        self.client.session.hooks['response'].append(self._mark_request)
+        
+        # Optional pinger so Binance doesn't close the idle connection
+        self._stop = threading.Event()
+        self._ka_thread = None
+        if config.binance.keepalive_ping:
+            self._ka_thread = threading.Thread(target=self._keepalive_loop, daemon=True)
+            self._ka_thread.start()
+        
+        # Stream-fed snapshots; a user-data event drops the account/positions
+        # snapshot so the next read refetches it over REST
+        self._stream_lock = threading.Lock()
+        # symbol -> (received at on the monotonic clock, last price)
+        self._price_cache: Dict[str, tuple] = {}
+        self._account_cache: Optional[Dict[str, Any]] = None
+        self._positions_cache: Optional[List[Dict[str, Any]]] = None
+        self._account_version = 0
+        self._price_streams = set()
+        self._order_listeners: List[Callable[[Optional[Dict[str, Any]]], None]] = []
+        self._twm = None
+        if config.binance.use_streams:
+            self._start_streams()
         
         logger.info(f"Binance client initialized (Testnet: {config.binance.testnet})")
         
-        # Cache for symbol info
-        self._symbol_info_cache = {}
-        self._last_cache_update = 0
-        self._cache_ttl = 300  # 5 minutes
+        # Symbol info cache: (symbol, field class) -> (expiry, value) on
+        # the monotonic clock, expiring per SYMBOL_INFO_TTLS
+        self._tiered: Dict[tuple, tuple] = {}
+        
+        # Derived per-symbol metadata: symbol -> (filters, precision, meta),
+        # rederived once _tiered hands out refreshed filters/precision
+        self._symbol_meta_cache: Dict[str, tuple] = {}
+        
+        # Very short-lived REST price cache: symbol -> (fetched at, price)
+        self._price_ttl = config.binance.price_cache_ttl
+        self._price_ttl_cache: Dict[str, tuple] = {}
+        self._price_ttl_lock = threading.Lock()
+        
+        # (fetched at, all open orders); dropped whenever orders change
+        self._open_orders_snapshot: Optional[tuple] = None
+    
+    @staticmethod
+    def _configure_session(session: requests.Session) -> None:
+        """Pool and keep alive HTTPS connections on python-binance's session"""
+        # Only idempotent requests are retried; a retried POST could
+        # place the same order twice. Rate limits (429/418) are not retried
+        # here, and the last 5xx is returned rather than raised, so callers
+        # still see BinanceAPIException and do their own backoff
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "DELETE"]),
+            raise_on_status=False,
+            respect_retry_after_header=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Connection": "keep-alive",
+            "Keep-Alive": "timeout=60, max=1000"
+        })
+    
+    def _mark_request(self, response, *args, **kwargs):
+        """Session response hook recording the last time the API was hit"""
+        self._last_request_ts = time.monotonic()
+    
+    def _keepalive_loop(self, idle: float = 3.0) -> None:
+        """Ping the API whenever the connection has been idle for `idle` seconds"""
+        while not self._stop.wait(1.0):
+            if time.monotonic() - self._last_request_ts > idle:
+                try:
+                    self.client.futures_ping()
+                except Exception as e:
+                    logger.debug(f"Keepalive ping failed: {e}")
+    
+    def _start_streams(self) -> None:
+        """Start the websocket manager and the futures user-data stream"""
+        self._twm = ThreadedWebsocketManager(
+            api_key=config.binance.api_key,
+            api_secret=config.binance.api_secret,
+            testnet=config.binance.testnet
+        )
+        self._twm.start()
+        self._twm.start_futures_user_socket(callback=self._on_user_event)
+        logger.info("Binance websocket streams started")
+    
+    def _watch_price(self, symbol: str) -> None:
+        """Subscribe to the ticker stream for symbol on first use"""
+        with self._stream_lock:
+            if symbol in self._price_streams:
+                return
+            self._price_streams.add(symbol)
+        self._twm.start_individual_symbol_ticker_futures_socket(
+            callback=self._on_ticker, symbol=symbol
+        )
+    
+    def _on_ticker(self, msg: Dict[str, Any]) -> None:
+        """Ticker stream callback: keep the last traded price per symbol"""
+        if msg.get('e') == '24hrTicker':
+            self._price_cache[msg['s']] = (time.monotonic(), float(msg['c']))
+        elif msg.get('e') == 'error':
+            # Fall back to REST until the stream delivers again
+            self._price_cache.clear()
+    
+    def _on_user_event(self, msg: Dict[str, Any]) -> None:
+        """User-data stream callback: any event (fills, ACCOUNT_UPDATE, stream
+        errors, listen-key expiry) invalidates the account snapshots"""
+        with self._stream_lock:
+            self._account_version += 1
+            self._account_cache = None
+            self._positions_cache = None
+            listeners = list(self._order_listeners)
+        
+        event = msg.get('e')
+        if event == 'ORDER_TRADE_UPDATE':
+            order = msg['o']
+        elif event == 'error':
+            # Fills may be lost while the socket reconnects; listeners
+            # re-check their orders over REST
+            order = None
+        else:
+            return
+        for listener in listeners:
+            try:
+                listener(order)
+            except Exception as e:
+                logger.log_error(e, "order listener")
+    
+    def add_order_listener(self, callback: Callable[[Optional[Dict[str, Any]]], None]) -> bool:
+        """Call `callback` with the order payload ('o') of every ORDER_TRADE_UPDATE,
+        and with None when the stream reports an error.
+        
+        Returns False when streams are disabled; callers then keep polling.
+        Callbacks run on the websocket thread and must not block on REST calls.
+        """
+        if self._twm is None:
+            return False
+        with self._stream_lock:
+            self._order_listeners.append(callback)
+        return True
+    
+    def remove_order_listener(self, callback: Callable[[Optional[Dict[str, Any]]], None]) -> None:
+        """Stop delivering order updates to callback"""
+        with self._stream_lock:
+            if callback in self._order_listeners:
+                self._order_listeners.remove(callback)
+    
+    def _store_snapshot(self, name: str, value: Any, version: int) -> None:
+        """Keep a REST result unless an account event arrived while fetching it"""
+        with self._stream_lock:
+            if version == self._account_version:
+                setattr(self, name, value)
+    
+    def close(self) -> None:
+        """Stop the keepalive pinger and streams and release pooled connections"""
+        self._stop.set()
+        if self._ka_thread is not None:
+            self._ka_thread.join(timeout=2)
+        if self._twm is not None:
+            self._twm.stop()
+        self.client.session.close()
     
     @log_execution_time
     def get_account_info(self) -> Dict[str, Any]:
         """Get futures account information"""
+        if self._account_cache is not None:
+            return self._account_cache
+        
         try:
+            version = self._account_version
             account_info = self.client.futures_account()
             
-            # Log balance updates
+            # Log funded balances as one record
+            balances = []
             for asset in account_info.get('assets', []):
-                if float(asset['walletBalance']) > 0:
-                    logger.log_balance_update(
-                        asset['asset'],
-                        float(asset['walletBalance']),
-                        float(asset['availableBalance'])
-                    )
+                name, wallet_balance, available_balance = _ASSET_FIELDS(asset)
+                wallet_balance = float(wallet_balance)
+                if wallet_balance > 0:
+                    balances.append((name, wallet_balance, float(available_balance)))
+            logger.log_balance_snapshot(balances)
             
+            if self._twm is not None:
+                self._store_snapshot('_account_cache', account_info, version)
             return account_info
         except BinanceAPIException as e:
             logger.log_error(e, "get_account_info")
             raise
     
+    def _refresh_symbol_info(self) -> set:
+        """Fetch exchange info into the tiered cache; returns the listed symbols"""
+        # The futures endpoint can't filter by symbol, so one fetch
+        # refreshes every entry
+        exchange_info = self.client.futures_exchange_info()
+        
+        current_time = time.monotonic()
+        expiry = {field: current_time + ttl for field, ttl in SYMBOL_INFO_TTLS.items()}
+        listed = set()
+        for sym_info in exchange_info['symbols']:
+            symbol = sym_info['symbol']
+            listed.add(symbol)
+            precision = {k: v for k, v in sym_info.items() if k not in ('status', 'filters')}
+            self._tiered[(symbol, 'status')] = (expiry['status'], sym_info.get('status'))
+            self._tiered[(symbol, 'filters')] = (expiry['filters'], sym_info.get('filters', []))
+            self._tiered[(symbol, 'precision')] = (expiry['precision'], precision)
+        return listed
+    
+    def _get_field(self, symbol: str, field: str) -> Any:
+        """One field class of a symbol's info, refreshed once its TTL lapses"""
+        cached = self._tiered.get((symbol, field))
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
+        if symbol not in self._refresh_symbol_info():
+            for field_class in SYMBOL_INFO_TTLS:
+                self._tiered.pop((symbol, field_class), None)
+            raise ValueError(f"Symbol {symbol} not found")
+        return self._tiered[(symbol, field)][1]
+    
     @log_execution_time
     def get_symbol_info(self, symbol: str) -> Dict[str, Any]:
         """Get symbol trading information with caching"""
-        current_time = time.time()
-        
-        # Check cache
-        if (symbol in self._symbol_info_cache and 
-            current_time - self._last_cache_update < self._cache_ttl):
-            return self._symbol_info_cache[symbol]
-        
         try:
-            exchange_info = self.client.futures_exchange_info()
-            
-            # Update cache
-            self._symbol_info_cache.clear()
-            for sym_info in exchange_info['symbols']:
-                self._symbol_info_cache[sym_info['symbol']] = sym_info
-            
-            self._last_cache_update = current_time
-            
-            if symbol not in self._symbol_info_cache:
-                raise ValueError(f"Symbol {symbol} not found")
-            
-            return self._symbol_info_cache[symbol]
+            symbol_info = dict(self._get_field(symbol, 'precision'))
+            symbol_info['filters'] = self._get_field(symbol, 'filters')
+            symbol_info['status'] = self._get_field(symbol, 'status')
+            return symbol_info
             
         except BinanceAPIException as e:
             logger.log_error(e, f"get_symbol_info for {symbol}")
@@ -94,25 +340,49 @@ class BinanceFuturesClient:
     @log_execution_time
     def get_current_price(self, symbol: str) -> float:
         """Get current market price for symbol"""
+        if self._twm is not None:
+            self._watch_price(symbol)
+            streamed = self._price_cache.get(symbol)
+            if streamed is not None and time.monotonic() - streamed[0] < STREAM_PRICE_MAX_AGE:
+                return streamed[1]
+        
+        # Bursts of reads within the TTL share one REST call
+        now = time.monotonic()
+        cached = self._price_ttl_cache.get(symbol)
+        if cached is not None and now - cached[0] < self._price_ttl:
+            return cached[1]
+        
         try:
             ticker = self.client.futures_symbol_ticker(symbol=symbol)
-            return float(ticker['price'])
+            price = float(ticker['price'])
+            with self._price_ttl_lock:
+                self._price_ttl_cache[symbol] = (now, price)
+            return price
         except BinanceAPIException as e:
             logger.log_error(e, f"get_current_price for {symbol}")
             raise
     
+    def _load_symbol_filters(self, symbol: str) -> None:
+        """Resolve the symbol's tick/step before validating an order for it"""
+        try:
+            self._get_symbol_meta(symbol.upper())
+        except Exception as e:
+            # Validation falls back to the configured precisions
+            logger.debug(f"No exchange filters for {symbol}: {e}")
+    
+    def prepare_order(self, symbol: str, side: str, quantity: float,
+                      price: Optional[float] = None) -> ValidatedOrder:
+        """Validate an order once for repeated submission via place_*_order"""
+        self._load_symbol_filters(symbol)
+        return validator.validate_order_fast(symbol, side, quantity, price)
+    
     @log_execution_time
-    def place_market_order(self, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
-        """Place a market order"""
+    def place_market_order(self, symbol: str, side: str, quantity: float,
+                           validated: Optional[ValidatedOrder] = None) -> Dict[str, Any]:
+        """Place a market order; a prepared `validated` order skips validation"""
         try:
             # Validate inputs
-            order_data = {
-                'symbol': symbol,
-                'side': side,
-                'quantity': quantity,
-                'order_type': 'MARKET'
-            }
-            validated_order = validator.validate_order_request(order_data)
+            validated_order = validated or self.prepare_order(symbol, side, quantity)
             
             # Log order attempt
             logger.log_order(
@@ -142,6 +412,7 @@ class BinanceFuturesClient:
                 status=order_result.get('status')
             )
             
+            self._open_orders_snapshot = None
             return order_result
             
         except (BinanceAPIException, BinanceOrderException) as e:
@@ -149,18 +420,12 @@ class BinanceFuturesClient:
             raise
     
     @log_execution_time
-    def place_limit_order(self, symbol: str, side: str, quantity: float, price: float) -> Dict[str, Any]:
-        """Place a limit order"""
+    def place_limit_order(self, symbol: str, side: str, quantity: float, price: float,
+                          validated: Optional[ValidatedOrder] = None) -> Dict[str, Any]:
+        """Place a limit order; a prepared `validated` order skips validation"""
         try:
             # Validate inputs
-            order_data = {
-                'symbol': symbol,
-                'side': side,
-                'quantity': quantity,
-                'price': price,
-                'order_type': 'LIMIT'
-            }
-            validated_order = validator.validate_order_request(order_data)
+            validated_order = validated or self.prepare_order(symbol, side, quantity, price)
             
             # Log order attempt
             logger.log_order(
@@ -168,7 +433,7 @@ class BinanceFuturesClient:
                 symbol=validated_order.symbol,
                 side=validated_order.side,
                 quantity=validated_order.quantity,
-                price=price,
+                price=validated_order.price,
                 order_type="LIMIT"
             )
             
@@ -179,7 +444,7 @@ class BinanceFuturesClient:
                 type=Client.ORDER_TYPE_LIMIT,
                 timeInForce=Client.TIME_IN_FORCE_GTC,
                 quantity=validated_order.quantity,
-                price=price
+                price=validated_order.price
             )
             
             # Log successful order
@@ -188,18 +453,77 @@ class BinanceFuturesClient:
                 symbol=validated_order.symbol,
                 side=validated_order.side,
                 quantity=validated_order.quantity,
-                price=price,
+                price=validated_order.price,
                 order_type="LIMIT",
                 order_id=order_result.get('orderId'),
                 status=order_result.get('status')
             )
             
+            self._open_orders_snapshot = None
             return order_result
             
         except (BinanceAPIException, BinanceOrderException) as e:
             logger.log_error(e, f"place_limit_order {side} {quantity} {symbol} @ {price}")
             raise
     
+    @log_execution_time
+    def place_batch_orders(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Place market/limit orders through batchOrders, MAX_BATCH_ORDERS per request.
+        
+        Each order is a dict with symbol, side, quantity and an optional price
+        (limit when given). Results come back in input order; a leg Binance
+        rejected is returned as its error dict ({'code': ..., 'msg': ...}).
+        """
+        for symbol in {order['symbol'] for order in orders if order.get('symbol')}:
+            self._load_symbol_filters(symbol)
+        validated_orders = validator.validate_batch_orders(orders)
+        
+        payload = []
+        for order in validated_orders:
+            leg = {
+                'symbol': order.symbol,
+                'side': order.side,
+                'type': order.order_type,
+                'quantity': _plain_number(order.quantity)
+            }
+            if order.order_type == 'LIMIT':
+                leg['timeInForce'] = Client.TIME_IN_FORCE_GTC
+                leg['price'] = _plain_number(order.price)
+            payload.append(leg)
+        
+        results = []
+        try:
+            for start in range(0, len(payload), MAX_BATCH_ORDERS):
+                results.extend(self.client.futures_place_batch_order(
+                    batchOrders=payload[start:start + MAX_BATCH_ORDERS]
+                ))
+        except (BinanceAPIException, BinanceOrderException) as e:
+            # Earlier chunks may have gone through
+            self._open_orders_snapshot = None
+            logger.log_error(e, f"place_batch_orders ({len(results)}/{len(payload)} submitted)")
+            raise
+        
+        for order, result in zip(validated_orders, results):
+            if 'code' in result:
+                logger.log_error(
+                    BinanceOrderException(result['code'], result.get('msg')),
+                    f"place_batch_orders {order.side} {order.quantity} {order.symbol}"
+                )
+            else:
+                logger.log_order(
+                    action="PLACED",
+                    symbol=order.symbol,
+                    side=order.side,
+                    quantity=order.quantity,
+                    price=order.price,
+                    order_type=order.order_type,
+                    order_id=result.get('orderId'),
+                    status=result.get('status')
+                )
+        
+        self._open_orders_snapshot = None
+        return results
+    
     @log_execution_time
     def place_stop_limit_order(self, symbol: str, side: str, quantity: float, 
                               stop_price: float, price: float) -> Dict[str, Any]:
@@ -240,6 +564,7 @@ class BinanceFuturesClient:
                 status=order_result.get('status')
             )
             
+            self._open_orders_snapshot = None
             return order_result
             
         except (BinanceAPIException, BinanceOrderException) as e:
@@ -252,18 +577,67 @@ class BinanceFuturesClient:
         try:
             result = self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
             logger.info(f"Order {order_id} cancelled for {symbol}")
+            self._open_orders_snapshot = None
             return result
         except BinanceAPIException as e:
             logger.log_error(e, f"cancel_order {order_id} for {symbol}")
             raise
     
+    def cancel_orders(self, symbol: str, order_ids: List[int]) -> List[Dict[str, Any]]:
+        """Cancel several orders on symbol through batchOrders, MAX_BATCH_CANCELS per request.
+        
+        Results come back in input order; an order Binance could not cancel
+        is returned as its error dict ({'code': ..., 'msg': ...}).
+        """
+        results = []
+        try:
+            for start in range(0, len(order_ids), MAX_BATCH_CANCELS):
+                chunk = order_ids[start:start + MAX_BATCH_CANCELS]
+                results.extend(self.client.futures_cancel_orders(
+                    symbol=symbol,
+                    orderIdList=f"[{','.join(str(order_id) for order_id in chunk)}]"
+                ))
+        except BinanceAPIException as e:
+            logger.log_error(e, f"cancel_orders ({len(results)}/{len(order_ids)} sent) for {symbol}")
+            raise
+        finally:
+            self._open_orders_snapshot = None
+        
+        for order_id, result in zip(order_ids, results):
+            if 'code' in result:
+                logger.log_error(
+                    BinanceOrderException(result['code'], result.get('msg')),
+                    f"cancel_orders {order_id} for {symbol}"
+                )
+            else:
+                logger.info(f"Order {order_id} cancelled for {symbol}")
+        return results
+    
     @log_execution_time
     def get_open_orders(self, symbol: str = None) -> List[Dict[str, Any]]:
-        """Get all open orders"""
+        """Get all open orders.
+        
+        An all-symbols fetch (request weight 40) is shared for
+        OPEN_ORDERS_TTL seconds. Symbol-scoped calls filter that snapshot
+        while it is fresh and otherwise make their own weight-1 request,
+        never the unfiltered one.
+        """
         try:
-            orders = self.client.futures_get_open_orders(symbol=symbol)
-            logger.debug(f"Retrieved {len(orders)} open orders")
-            return orders
+            now = time.monotonic()
+            snapshot = self._open_orders_snapshot
+            fresh = snapshot is not None and now - snapshot[0] < OPEN_ORDERS_TTL
+            
+            if symbol is not None:
+                if fresh:
+                    return [order for order in snapshot[1] if order['symbol'] == symbol]
+                orders = self.client.futures_get_open_orders(symbol=symbol)
+                logger.debug(f"Retrieved {len(orders)} open orders for {symbol}")
+                return orders
+            
+            if not fresh:
+                snapshot = self._open_orders_snapshot = (now, self.client.futures_get_open_orders())
+                logger.debug(f"Retrieved {len(snapshot[1])} open orders")
+            return list(snapshot[1])
         except BinanceAPIException as e:
             logger.log_error(e, "get_open_orders")
             raise
@@ -281,76 +655,131 @@ class BinanceFuturesClient:
     @log_execution_time
     def get_positions(self) -> List[Dict[str, Any]]:
         """Get current positions"""
+        if self._positions_cache is not None:
+            return self._positions_cache
+        
         try:
+            version = self._account_version
             positions = self.client.futures_position_information()
             
-            # Log non-zero positions with safe key access
+            # Collect non-zero positions, logged as one record
             active_positions = []
+            position_rows = []
             for position in positions:
-                position_amt = float(position.get('positionAmt', 0))
+                symbol, position_amt, entry_price = _POSITION_FIELDS(position)
+                position_amt = float(position_amt)
                 if position_amt != 0:
-                    # Safe key access with defaults
-                    unrealized_profit = float(position.get('unrealizedProfit', position.get('unRealizedProfit', 0)))
-                    entry_price = float(position.get('entryPrice', 0))
+                    # The PnL key's casing differs between endpoints
+                    unrealized_profit = float(position.get('unRealizedProfit', position.get('unrealizedProfit', 0)))
                     
-                    logger.log_position_update(
-                        position['symbol'],
-                        position_amt,
-                        unrealized_profit,
-                        entry_price
-                    )
+                    position_rows.append((symbol, position_amt, unrealized_profit, float(entry_price)))
                     active_positions.append(position)
             
+            logger.log_position_snapshot(position_rows)
+            
+            if self._twm is not None:
+                self._store_snapshot('_positions_cache', active_positions, version)
             return active_positions
         except BinanceAPIException as e:
             logger.log_error(e, "get_positions")
             raise
     
     @log_execution_time
-    def get_klines(self, symbol: str, interval: str, limit: int = 100) -> List[List]:
-        """Get kline/candlestick data"""
+    def get_klines(self, symbol: str, interval: str, limit: int = 100,
+                   raw: bool = False) -> Union[np.ndarray, List[List]]:
+        """Get kline/candlestick data.
+        
+        Returns a float64 array with columns (open_time, open, high, low,
+        close, volume, close_time), times in ms; raw=True returns the API's
+        list of string lists unchanged.
+        """
         try:
             klines = self.client.futures_klines(
                 symbol=symbol,
                 interval=interval,
                 limit=limit
             )
-            return klines
         except BinanceAPIException as e:
             logger.log_error(e, f"get_klines {symbol}")
             raise
+        
+        if raw:
+            return klines
+        
+        # Parse every candle in one pass per column block
+        arr = np.asarray(klines, dtype=object).reshape(-1, 12)
+        out = np.empty((len(arr), 7), dtype=np.float64)
+        out[:, 0] = arr[:, 0].astype(np.int64)
+        out[:, 1:6] = arr[:, 1:6].astype(np.float64)
+        out[:, 6] = arr[:, 6].astype(np.int64)
+        return out
+    
+    def _get_symbol_meta(self, symbol: str) -> SymbolMeta:
+        """Precisions and min notional for symbol, following the tiered cache's TTLs"""
+        filters = self._get_field(symbol, 'filters')
+        precision = self._get_field(symbol, 'precision')
+        cached = self._symbol_meta_cache.get(symbol)
+        if cached is not None and cached[0] is filters and cached[1] is precision:
+            return cached[2]
+        
+        min_notional = 0.0
+        tick_size = step_size = None
+        for filter_info in filters:
+            filter_type = filter_info['filterType']
+            if filter_type == 'MIN_NOTIONAL':
+                min_notional = float(filter_info['notional'])
+            elif filter_type == 'PRICE_FILTER':
+                tick_size = filter_info['tickSize']
+            elif filter_type == 'LOT_SIZE':
+                step_size = filter_info['stepSize']
+        
+        # Let the validators snap prices/quantities to exact ticks
+        if tick_size and step_size:
+            register_symbol_filters(symbol, tick_size, step_size)
+        meta = SymbolMeta(
+            price_precision=precision.get('pricePrecision', 2),
+            quantity_precision=precision.get('quantityPrecision', 3),
+            min_notional=min_notional
+        )
+        self._symbol_meta_cache[symbol] = (filters, precision, meta)
+        return meta
     
     def validate_symbol(self, symbol: str) -> bool:
         """Validate if symbol exists and is tradable"""
         try:
-            symbol_info = self.get_symbol_info(symbol)
-            return symbol_info.get('status') == 'TRADING'
+            return self._get_field(symbol, 'status') == 'TRADING'
         except:
             return False
     
     def get_min_notional(self, symbol: str) -> float:
         """Get minimum notional value for symbol"""
         try:
-            symbol_info = self.get_symbol_info(symbol)
-            for filter_info in symbol_info.get('filters', []):
-                if filter_info['filterType'] == 'MIN_NOTIONAL':
-                    return float(filter_info['notional'])
-            return 0.0
+            return self._get_symbol_meta(symbol).min_notional
         except:
             return 0.0
     
     def get_price_precision(self, symbol: str) -> int:
         """Get price precision for symbol"""
         try:
-            symbol_info = self.get_symbol_info(symbol)
-            return symbol_info.get('pricePrecision', 2)
+            return self._get_symbol_meta(symbol).price_precision
         except:
             return 2
     
     def get_quantity_precision(self, symbol: str) -> int:
         """Get quantity precision for symbol"""
         try:
-            symbol_info = self.get_symbol_info(symbol)
-            return symbol_info.get('quantityPrecision', 3)
+            return self._get_symbol_meta(symbol).quantity_precision
         except:
-            return 3
\ No newline at end of file
+            return 3
+
+_shared_client: Optional[BinanceFuturesClient] = None
+_shared_client_lock = threading.Lock()
+
+def get_shared_client() -> BinanceFuturesClient:
+    """Process-wide client, created on first use, so callers share one connection pool"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = BinanceFuturesClient()
+    return _shared_client
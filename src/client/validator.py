@@ -5,14 +5,11 @@ Validates symbols, quantities, prices, and other trading parameters
 """
 
 import re
+import functools
+from dataclasses import dataclass
 from typing import Union, List, Optional
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal, InvalidOperation, ROUND_DOWN, ROUND_HALF_UP
 from pydantic import BaseModel, validator, Field
-import sys
-import os
-
-# Add src to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 try:
     from ..utils.config import config
@@ -21,6 +18,97 @@ except ImportError:
     from utils.config import config
     from utils.logger import logger
 
+# Hot-path validation state, built once at import
+_SYMBOL_RE = re.compile(r'^[A-Z0-9]{6,}$')
+_SIDES = frozenset(('BUY', 'SELL'))
+
+@functools.lru_cache(maxsize=512)
+def _canon_symbol(v: str) -> str:
+    """Uppercase and validate a symbol; repeat symbols skip the regex entirely"""
+    u = v.upper() if v else ''
+    if not _SYMBOL_RE.match(u):
+        if len(u) < 6:
+            raise ValueError("Symbol must be at least 6 characters")
+        raise ValueError("Symbol must contain only uppercase letters and numbers")
+    return u
+
+# symbol -> (tick size, step size) from the exchange PRICE_FILTER/LOT_SIZE
+# filters, registered by the client as it resolves each symbol
+_SYMBOL_FILTERS = {}
+
+def register_symbol_filters(symbol: str, tick_size: str, step_size: str) -> None:
+    """Record a symbol's price tick and quantity step for snapping"""
+    _SYMBOL_FILTERS[symbol] = (Decimal(tick_size).normalize(), Decimal(step_size).normalize())
+
+def _snap(value: float, increment: Decimal, rounding: str) -> float:
+    """Snap value to a multiple of increment with decimal arithmetic"""
+    steps = (Decimal(str(value)) / increment).to_integral_value(rounding=rounding)
+    return float(steps * increment)
+
+def snap_price(price: float, symbol: Optional[str] = None) -> float:
+    """Round price to the symbol's tick (nearest), or to the configured precision"""
+    filters = _SYMBOL_FILTERS.get(symbol)
+    tick = filters[0] if filters else Decimal(1).scaleb(-config.trading.price_precision)
+    return _snap(price, tick, ROUND_HALF_UP)
+
+def snap_quantity(quantity: float, symbol: Optional[str] = None) -> float:
+    """Round quantity down to the symbol's lot step, or round to the configured precision"""
+    filters = _SYMBOL_FILTERS.get(symbol)
+    if filters:
+        return _snap(quantity, filters[1], ROUND_DOWN)
+    return _snap(quantity, Decimal(1).scaleb(-config.trading.quantity_precision), ROUND_HALF_UP)
+
+def _check_quantity(v: float, symbol: Optional[str] = None) -> float:
+    """Quantity bounds from the trading config, snapped to the lot step"""
+    if v <= 0:
+        raise ValueError("Quantity must be positive")
+    
+    if v < config.trading.min_quantity:
+        raise ValueError(f"Quantity must be at least {config.trading.min_quantity}")
+    
+    if v > config.trading.max_quantity:
+        raise ValueError(f"Quantity cannot exceed {config.trading.max_quantity}")
+    
+    snapped = snap_quantity(v, symbol)
+    if snapped <= 0:
+        raise ValueError("Quantity is smaller than the symbol's lot step")
+    return snapped
+
+@dataclass(frozen=True)
+class ValidatedOrder:
+    """An order that already passed validation; safe to submit as-is"""
+    __slots__ = ('symbol', 'side', 'quantity', 'price', 'order_type')
+    symbol: str
+    side: str
+    quantity: float
+    price: Optional[float]
+    order_type: str
+
+def fast_validate_order(symbol: str, side: str, quantity: float,
+                        price: Optional[float] = None, order_type: str = None) -> ValidatedOrder:
+    """Validate an order without building a pydantic model.
+    
+    Applies the same rules as OrderRequest/LimitOrderRequest and raises
+    ValueError on the first failure.
+    """
+    symbol = _canon_symbol(symbol)
+    
+    side = side.upper()
+    if side not in _SIDES:
+        raise ValueError(f"Side must be one of: {sorted(_SIDES)}")
+    
+    quantity = _check_quantity(quantity, symbol)
+    
+    if price is not None:
+        if price <= 0:
+            raise ValueError("Price must be positive")
+        price = snap_price(price, symbol)
+    
+    if order_type is None:
+        order_type = 'MARKET' if price is None else 'LIMIT'
+    
+    return ValidatedOrder(symbol, side, quantity, price, order_type)
+
 class OrderRequest(BaseModel):
     """Base order request validation model"""
     symbol: str = Field(..., description="Trading symbol (e.g., BTCUSDT)")
@@ -30,14 +118,8 @@ class OrderRequest(BaseModel):
     
     @validator('symbol')
     def validate_symbol(cls, v):
-        if not v or len(v) < 6:
-            raise ValueError("Symbol must be at least 6 characters")
-        
-        # Basic format validation (letters and numbers only)
-        if not re.match(r'^[A-Z0-9]+$', v.upper()):
-            raise ValueError("Symbol must contain only uppercase letters and numbers")
-        
-        return v.upper()
+        # At least 6 letters/numbers, checked once per distinct symbol
+        return _canon_symbol(v)
     
     @validator('side')
     def validate_side(cls, v):
@@ -47,17 +129,8 @@ class OrderRequest(BaseModel):
         return v.upper()
     
     @validator('quantity')
-    def validate_quantity(cls, v):
-        if v <= 0:
-            raise ValueError("Quantity must be positive")
-        
-        if v < config.trading.min_quantity:
-            raise ValueError(f"Quantity must be at least {config.trading.min_quantity}")
-        
-        if v > config.trading.max_quantity:
-            raise ValueError(f"Quantity cannot exceed {config.trading.max_quantity}")
-        
-        return round(v, config.trading.quantity_precision)
+    def validate_quantity(cls, v, values):
+        return _check_quantity(v, values.get('symbol'))
     
     @validator('order_type')
     def validate_order_type(cls, v):
@@ -72,10 +145,10 @@ class LimitOrderRequest(OrderRequest):
     order_type: str = Field(default="LIMIT")
     
     @validator('price')
-    def validate_price(cls, v):
+    def validate_price(cls, v, values):
         if v <= 0:
             raise ValueError("Price must be positive")
-        return round(v, config.trading.price_precision)
+        return snap_price(v, values.get('symbol'))
 
 class StopOrderRequest(OrderRequest):
     """Stop order validation model"""
@@ -83,17 +156,17 @@ class StopOrderRequest(OrderRequest):
     price: Optional[float] = Field(None, gt=0, description="Limit price for stop-limit orders")
     
     @validator('stop_price')
-    def validate_stop_price(cls, v):
+    def validate_stop_price(cls, v, values):
         if v <= 0:
             raise ValueError("Stop price must be positive")
-        return round(v, config.trading.price_precision)
+        return snap_price(v, values.get('symbol'))
     
     @validator('price')
-    def validate_limit_price(cls, v):
+    def validate_limit_price(cls, v, values):
         if v is not None and v <= 0:
             raise ValueError("Limit price must be positive")
         if v is not None:
-            return round(v, config.trading.price_precision)
+            return snap_price(v, values.get('symbol'))
         return v
 
 class OCOOrderRequest(BaseModel):
@@ -114,15 +187,15 @@ class OCOOrderRequest(BaseModel):
         return OrderRequest.validate_side(v)
     
     @validator('quantity')
-    def validate_quantity(cls, v):
-        return OrderRequest.validate_quantity(v)
+    def validate_quantity(cls, v, values):
+        return _check_quantity(v, values.get('symbol'))
     
     @validator('price', 'stop_price', 'stop_limit_price')
-    def validate_prices(cls, v):
+    def validate_prices(cls, v, values):
         if v is not None and v <= 0:
             raise ValueError("Price must be positive")
         if v is not None:
-            return round(v, config.trading.price_precision)
+            return snap_price(v, values.get('symbol'))
         return v
 
 class TWAPOrderRequest(BaseModel):
@@ -171,11 +244,24 @@ class GridOrderRequest(BaseModel):
     def validate_price_range(cls, v, values):
         if 'lower_price' in values and v <= values['lower_price']:
             raise ValueError("Upper price must be greater than lower price")
-        return round(v, config.trading.price_precision)
+        return snap_price(v, values.get('symbol'))
     
     @validator('lower_price')
-    def validate_lower_price(cls, v):
-        return round(v, config.trading.price_precision)
+    def validate_lower_price(cls, v, values):
+        return snap_price(v, values.get('symbol'))
+
+class BatchOrderRequest(BaseModel):
+    """Batch order validation model (market or limit legs)"""
+    orders: List[dict] = Field(..., description="Order legs: symbol, side, quantity and optional price")
+    
+    @validator('orders')
+    def validate_orders(cls, v):
+        if not v:
+            raise ValueError("Batch must contain at least one order")
+        return [
+            fast_validate_order(o.get('symbol'), o.get('side', ''), o.get('quantity', 0), o.get('price'))
+            for o in v
+        ]
 
 class TradingValidator:
     """Main validation class for trading operations"""
@@ -192,19 +278,19 @@ class TradingValidator:
     
     @staticmethod
     def validate_price_precision(price: float, symbol: str = None) -> float:
-        """Validate and round price to appropriate precision"""
+        """Validate and round price to the symbol's tick (or configured precision)"""
         try:
-            return round(price, config.trading.price_precision)
-        except (TypeError, ValueError) as e:
+            return snap_price(price, symbol)
+        except (TypeError, ValueError, InvalidOperation) as e:
             logger.error(f"Price precision validation failed: {e}")
             raise ValueError(f"Invalid price format: {price}")
     
     @staticmethod
-    def validate_quantity_precision(quantity: float) -> float:
-        """Validate and round quantity to appropriate precision"""
+    def validate_quantity_precision(quantity: float, symbol: str = None) -> float:
+        """Validate and round quantity to the symbol's lot step (or configured precision)"""
         try:
-            return round(quantity, config.trading.quantity_precision)
-        except (TypeError, ValueError) as e:
+            return snap_quantity(quantity, symbol)
+        except (TypeError, ValueError, InvalidOperation) as e:
             logger.error(f"Quantity precision validation failed: {e}")
             raise ValueError(f"Invalid quantity format: {quantity}")
     
@@ -221,8 +307,17 @@ class TradingValidator:
         return symbol.upper().strip()
     
     @staticmethod
-    def validate_order_request(order_data: dict) -> OrderRequest:
-        """Validate complete order request"""
+    def validate_order_request(order_data: dict, return_dataclass: bool = False):
+        """Validate complete order request.
+        
+        With return_dataclass=True the pydantic models are skipped and a
+        ValidatedOrder is returned, for reuse with place_*_order.
+        """
+        if return_dataclass:
+            price = order_data.get('price') if order_data.get('order_type') == 'LIMIT' else None
+            return TradingValidator.validate_order_fast(
+                order_data.get('symbol'), order_data.get('side', ''), order_data.get('quantity', 0), price
+            )
         try:
             if order_data.get('order_type') == 'LIMIT' and 'price' in order_data:
                 return LimitOrderRequest(**order_data)
@@ -231,6 +326,25 @@ class TradingValidator:
         except Exception as e:
             logger.log_error(e, "Order validation")
             raise ValueError(f"Order validation failed: {str(e)}")
+    
+    @staticmethod
+    def validate_batch_orders(orders: List[dict]) -> List[ValidatedOrder]:
+        """Validate every leg of a batch order"""
+        try:
+            return BatchOrderRequest(orders=orders).orders
+        except Exception as e:
+            logger.log_error(e, "Batch order validation")
+            raise ValueError(f"Batch order validation failed: {str(e)}")
+    
+    @staticmethod
+    def validate_order_fast(symbol: str, side: str, quantity: float,
+                            price: Optional[float] = None) -> ValidatedOrder:
+        """Validate an order on the submission hot path (no pydantic model)"""
+        try:
+            return fast_validate_order(symbol, side, quantity, price)
+        except ValueError as e:
+            logger.log_error(e, "Order validation")
+            raise ValueError(f"Order validation failed: {str(e)}")
 
 # Create global validator instance
 validator = TradingValidator()
\ No newline at end of file
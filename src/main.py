@@ -5,13 +5,11 @@ Provides unified interface for all trading operations
 """
 
 import click
+import functools
 import sys
 import os
+import time
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich import print as rprint
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -19,51 +17,78 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Fix imports for direct execution
 try:
     # Try relative imports first (when run as module)
-    from .client.binance_client import BinanceFuturesClient
-    from .orders.market_orders import MarketOrderManager
-    from .orders.limit_orders import LimitOrderManager
-    from .orders.advanced.oco import OCOOrderManager
-    from .orders.advanced.grid import GridTradingManager
     from .utils.logger import logger
     from .utils.config import config
 except ImportError:
     # Fall back to absolute imports (when run directly)
-    from client.binance_client import BinanceFuturesClient
-    from orders.market_orders import MarketOrderManager
-    from orders.limit_orders import LimitOrderManager
-    from orders.advanced.oco import OCOOrderManager
-    from orders.advanced.grid import GridTradingManager
     from utils.logger import logger
     from utils.config import config
 
-console = Console()
+# Built on first use so `version` and `--help` skip importing Rich
+_console = None
+
+def _get_console():
+    """Return the shared Rich console, creating it on first call"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+@functools.lru_cache(maxsize=None)
+def _trading_components():
+    """Import the client and order managers once, when a command first needs them"""
+    try:
+        from .client.binance_client import BinanceFuturesClient
+        from .orders.market_orders import MarketOrderManager
+        from .orders.limit_orders import LimitOrderManager
+        from .orders.advanced.oco import OCOOrderManager
+        from .orders.advanced.grid import GridTradingManager
+    except ImportError:
+        from client.binance_client import BinanceFuturesClient
+        from orders.market_orders import MarketOrderManager
+        from orders.limit_orders import LimitOrderManager
+        from orders.advanced.oco import OCOOrderManager
+        from orders.advanced.grid import GridTradingManager
+    return (BinanceFuturesClient, MarketOrderManager, LimitOrderManager,
+            OCOOrderManager, GridTradingManager)
 
 class TradingBot:
     """Main trading bot application"""
     
+    __slots__ = ("client", "market_manager", "limit_manager", "oco_manager",
+                 "grid_manager", "_account_cache", "_positions_cache")
+    
     def __init__(self):
         self.client = None
         self.market_manager = None
         self.limit_manager = None
         self.oco_manager = None
         self.grid_manager = None
+        self._account_cache = (None, 0.0)
+        self._positions_cache = (None, 0.0)
         
     def initialize(self):
         """Initialize trading bot components"""
+        console = _get_console()
         try:
+            (BinanceFuturesClient, MarketOrderManager, LimitOrderManager,
+             OCOOrderManager, GridTradingManager) = _trading_components()
+            
             console.print("[bold blue]Initializing Binance Trading Bot...[/bold blue]")
             
             # Initialize client
             self.client = BinanceFuturesClient()
             
-            # Initialize order managers
-            self.market_manager = MarketOrderManager()
-            self.limit_manager = LimitOrderManager()
-            self.oco_manager = OCOOrderManager()
-            self.grid_manager = GridTradingManager()
+            # Initialize order managers on the same client and connection pool
+            self.market_manager = MarketOrderManager(client=self.client)
+            self.limit_manager = LimitOrderManager(client=self.client)
+            self.oco_manager = OCOOrderManager(client=self.client)
+            self.grid_manager = GridTradingManager(client=self.client)
             
-            # Test connection
+            # Test connection; keep the response so the summary can reuse it
             account_info = self.client.get_account_info()
+            self._account_cache = (account_info, time.monotonic())
             
             console.print("[green]✓ Bot initialized successfully[/green]")
             logger.info("Trading bot initialized successfully")
@@ -77,6 +102,8 @@ class TradingBot:
     
     def display_welcome(self):
         """Display welcome message and account info"""
+        from rich.panel import Panel
+        
         welcome_text = """
 [bold cyan]🚀 Binance Futures Trading Bot[/bold cyan]
 
@@ -90,13 +117,38 @@ class TradingBot:
 [yellow]Environment:[/yellow] {'Testnet' if config.binance.testnet else 'Live Trading'}
         """
         
-        console.print(Panel(welcome_text, border_style="blue"))
+        _get_console().print(Panel(welcome_text, border_style="blue"))
+    
+    def set_no_confirm(self, no_confirm: bool):
+        """Enable or disable the confirmation prompt on every order manager"""
+        for manager in (self.market_manager, self.limit_manager,
+                        self.oco_manager, self.grid_manager):
+            manager.interactive = not no_confirm
+    
+    def _cached_account(self, max_age: float = 1.0):
+        """Return account info, refetching only if the cached copy is older than max_age"""
+        account_info, fetched_at = self._account_cache
+        if account_info is None or time.monotonic() - fetched_at >= max_age:
+            account_info = self.client.get_account_info()
+            self._account_cache = (account_info, time.monotonic())
+        return account_info
+    
+    def _cached_positions(self, max_age: float = 1.0):
+        """Return open positions, refetching only if the cached copy is older than max_age"""
+        positions, fetched_at = self._positions_cache
+        if positions is None or time.monotonic() - fetched_at >= max_age:
+            positions = self.client.get_positions()
+            self._positions_cache = (positions, time.monotonic())
+        return positions
     
     def display_account_summary(self):
         """Display account summary"""
+        from rich.table import Table
+        
+        console = _get_console()
         try:
-            account_info = self.client.get_account_info()
-            positions = self.client.get_positions()
+            account_info = self._cached_account()
+            positions = self._cached_positions()
             
             # Account balance table
             balance_table = Table(title="Account Balance", show_header=True, header_style="bold green")
@@ -106,14 +158,16 @@ class TradingBot:
             balance_table.add_column("Unrealized PnL", style="white")
             
             for asset in account_info.get('assets', []):
-                if float(asset['walletBalance']) > 0:
-                    pnl_color = "green" if float(asset['unrealizedProfit']) >= 0 else "red"
-                    balance_table.add_row(
-                        asset['asset'],
-                        f"{float(asset['walletBalance']):.4f}",
-                        f"{float(asset['availableBalance']):.4f}",
-                        f"[{pnl_color}]{float(asset['unrealizedProfit']):+.4f}[/{pnl_color}]"
-                    )
+                wallet = float(asset['walletBalance'])
+                if wallet <= 0:
+                    continue
+                pnl = float(asset['unrealizedProfit'])
+                balance_table.add_row(
+                    asset['asset'],
+                    f"{wallet:.4f}",
+                    f"{float(asset['availableBalance']):.4f}",
+                    f"[{'green' if pnl >= 0 else 'red'}]{pnl:+.4f}[/]"
+                )
             
             console.print(balance_table)
             
@@ -131,15 +185,18 @@ class TradingBot:
                     # Safe key access with fallbacks
                     pnl = float(pos.get('unrealizedProfit', pos.get('unRealizedProfit', 0)))
                     roe = float(pos.get('percentage', pos.get('roe', 0)))
+                    amount = float(pos.get('positionAmt', 0))
+                    entry = float(pos.get('entryPrice', 0))
+                    mark = float(pos.get('markPrice', 0))
                     pnl_color = "green" if pnl >= 0 else "red"
                     
                     pos_table.add_row(
                         pos['symbol'],
-                        f"{float(pos.get('positionAmt', 0)):.6f}",
-                        f"${float(pos.get('entryPrice', 0)):,.2f}",
-                        f"${float(pos.get('markPrice', 0)):,.2f}",
-                        f"[{pnl_color}]{pnl:+.4f}[/{pnl_color}]",
-                        f"[{pnl_color}]{roe:+.2f}%[/{pnl_color}]"
+                        f"{amount:.6f}",
+                        f"${entry:,.2f}",
+                        f"${mark:,.2f}",
+                        f"[{pnl_color}]{pnl:+.4f}[/]",
+                        f"[{pnl_color}]{roe:+.2f}%[/]"
                     )
                 
                 console.print(pos_table)
@@ -150,20 +207,56 @@ class TradingBot:
             console.print(f"[red]Error getting account info: {str(e)}[/red]")
             logger.log_error(e, "display_account_summary")
 
-@click.group(invoke_without_command=True)
+@click.group(invoke_without_command=True, chain=True)
 @click.pass_context
 def cli(ctx):
     """
     Binance Futures Trading Bot - Professional CLI Interface
     
     Use --help with any command for detailed usage information.
+    Commands can be chained, e.g. `account orders --symbol BTCUSDT`.
     """
+    ctx.ensure_object(dict)
+    # In a chained group invoked_subcommand is '*' when any command follows
     if ctx.invoked_subcommand is None:
         # Interactive mode when no subcommand is provided
         interactive_mode()
 
+def get_bot(ctx):
+    """Return the invocation's bot, initializing it on first use.
+    
+    The bot lives on ctx.obj so every command in a chain shares one client
+    and its pooled HTTP session. Returns None if initialization fails.
+    """
+    bot = ctx.obj.get('bot')
+    if bot is None:
+        bot = TradingBot()
+        if not bot.initialize():
+            return None
+        ctx.obj['bot'] = bot
+    return bot
+
+_MENU_TEXT = (
+    "\n[bold cyan]Main Menu:[/bold cyan]\n"
+    "1. Account Summary\n"
+    "2. Market Order\n"
+    "3. Limit Order\n"
+    "4. OCO Order\n"
+    "5. Grid Trading\n"
+    "6. List Open Orders\n"
+    "7. Market Info\n"
+    "8. Exit"
+)
+
+_SIDE_CHOICE = click.Choice(['BUY', 'SELL'], case_sensitive=False)
+
+def _ask_symbol() -> str:
+    """Prompt for a trading symbol"""
+    return click.prompt("Symbol", default="BTCUSDT").upper()
+
 def interactive_mode():
     """Interactive mode for the trading bot"""
+    console = _get_console()
     bot = TradingBot()
     
     # Initialize bot
@@ -176,15 +269,7 @@ def interactive_mode():
     
     while True:
         try:
-            console.print("\n[bold cyan]Main Menu:[/bold cyan]")
-            console.print("1. Account Summary")
-            console.print("2. Market Order")
-            console.print("3. Limit Order")
-            console.print("4. OCO Order")
-            console.print("5. Grid Trading")
-            console.print("6. List Open Orders")
-            console.print("7. Market Info")
-            console.print("8. Exit")
+            console.print(_MENU_TEXT)
             
             choice = click.prompt("\nSelect an option", type=int, default=1)
             
@@ -192,15 +277,15 @@ def interactive_mode():
                 bot.display_account_summary()
             
             elif choice == 2:
-                symbol = click.prompt("Symbol", default="BTCUSDT").upper()
-                side = click.prompt("Side (BUY/SELL)", type=click.Choice(['BUY', 'SELL'], case_sensitive=False)).upper()
+                symbol = _ask_symbol()
+                side = click.prompt("Side (BUY/SELL)", type=_SIDE_CHOICE).upper()
                 quantity = click.prompt("Quantity", type=float)
                 
                 bot.market_manager.execute_market_order(symbol, side, quantity)
             
             elif choice == 3:
-                symbol = click.prompt("Symbol", default="BTCUSDT").upper()
-                side = click.prompt("Side (BUY/SELL)", type=click.Choice(['BUY', 'SELL'], case_sensitive=False)).upper()
+                symbol = _ask_symbol()
+                side = click.prompt("Side (BUY/SELL)", type=_SIDE_CHOICE).upper()
                 quantity = click.prompt("Quantity", type=float)
                 price = click.prompt("Limit Price", type=float)
                 wait = click.confirm("Wait for fill?", default=False)
@@ -208,8 +293,8 @@ def interactive_mode():
                 bot.limit_manager.execute_limit_order(symbol, side, quantity, price, wait)
             
             elif choice == 4:
-                symbol = click.prompt("Symbol", default="BTCUSDT").upper()
-                side = click.prompt("Side (BUY/SELL)", type=click.Choice(['BUY', 'SELL'], case_sensitive=False)).upper()
+                symbol = _ask_symbol()
+                side = click.prompt("Side (BUY/SELL)", type=_SIDE_CHOICE).upper()
                 quantity = click.prompt("Quantity", type=float)
                 limit_price = click.prompt("Take Profit Price", type=float)
                 stop_price = click.prompt("Stop Loss Price", type=float)
@@ -221,7 +306,7 @@ def interactive_mode():
                 )
             
             elif choice == 5:
-                symbol = click.prompt("Symbol", default="BTCUSDT").upper()
+                symbol = _ask_symbol()
                 quantity_per_grid = click.prompt("Quantity per grid level", type=float)
                 grid_count = click.prompt("Number of grid levels", type=int, default=10)
                 lower_price = click.prompt("Lower price boundary", type=float)
@@ -236,7 +321,7 @@ def interactive_mode():
                 bot.limit_manager.list_open_orders(symbol.upper() if symbol else None)
             
             elif choice == 7:
-                symbol = click.prompt("Symbol", default="BTCUSDT").upper()
+                symbol = _ask_symbol()
                 bot.market_manager.display_market_summary(symbol)
             
             elif choice == 8:
@@ -258,13 +343,13 @@ def interactive_mode():
 @click.argument('side', type=click.Choice(['BUY', 'SELL'], case_sensitive=False))
 @click.argument('quantity', type=float)
 @click.option('--no-confirm', is_flag=True, help='Skip confirmation')
-def market(symbol: str, side: str, quantity: float, no_confirm: bool):
+@click.pass_context
+def market(ctx, symbol: str, side: str, quantity: float, no_confirm: bool):
     """Place a market order"""
     try:
-        bot = TradingBot()
-        if bot.initialize():
-            if no_confirm:
-                bot.market_manager._confirm_order = lambda *args: True
+        bot = get_bot(ctx)
+        if bot:
+            bot.set_no_confirm(no_confirm)
             bot.market_manager.execute_market_order(symbol.upper(), side.upper(), quantity)
     except Exception as e:
         raise click.ClickException(str(e))
@@ -276,13 +361,13 @@ def market(symbol: str, side: str, quantity: float, no_confirm: bool):
 @click.argument('price', type=float)
 @click.option('--wait', is_flag=True, help='Wait for order to fill')
 @click.option('--no-confirm', is_flag=True, help='Skip confirmation')
-def limit(symbol: str, side: str, quantity: float, price: float, wait: bool, no_confirm: bool):
+@click.pass_context
+def limit(ctx, symbol: str, side: str, quantity: float, price: float, wait: bool, no_confirm: bool):
     """Place a limit order"""
     try:
-        bot = TradingBot()
-        if bot.initialize():
-            if no_confirm:
-                bot.limit_manager._confirm_limit_order = lambda *args: True
+        bot = get_bot(ctx)
+        if bot:
+            bot.set_no_confirm(no_confirm)
             bot.limit_manager.execute_limit_order(symbol.upper(), side.upper(), quantity, price, wait)
     except Exception as e:
         raise click.ClickException(str(e))
@@ -295,14 +380,14 @@ def limit(symbol: str, side: str, quantity: float, price: float, wait: bool, no_
 @click.argument('stop_price', type=float)
 @click.option('--stop-limit', type=float, help='Stop limit price')
 @click.option('--no-confirm', is_flag=True, help='Skip confirmation')
-def oco(symbol: str, side: str, quantity: float, limit_price: float, stop_price: float, 
+@click.pass_context
+def oco(ctx, symbol: str, side: str, quantity: float, limit_price: float, stop_price: float, 
         stop_limit: float, no_confirm: bool):
     """Place an OCO order"""
     try:
-        bot = TradingBot()
-        if bot.initialize():
-            if no_confirm:
-                bot.oco_manager._confirm_oco_order = lambda *args: True
+        bot = get_bot(ctx)
+        if bot:
+            bot.set_no_confirm(no_confirm)
             bot.oco_manager.execute_oco_order(
                 symbol.upper(), side.upper(), quantity, limit_price, stop_price, stop_limit
             )
@@ -317,14 +402,14 @@ def oco(symbol: str, side: str, quantity: float, limit_price: float, stop_price:
 @click.argument('upper_price', type=float)
 @click.option('--side', type=click.Choice(['BOTH', 'BUY_ONLY', 'SELL_ONLY']), default='BOTH', help='Grid direction')
 @click.option('--no-confirm', is_flag=True, help='Skip confirmation')
-def grid(symbol: str, quantity_per_grid: float, grid_count: int, lower_price: float, 
+@click.pass_context
+def grid(ctx, symbol: str, quantity_per_grid: float, grid_count: int, lower_price: float, 
          upper_price: float, side: str, no_confirm: bool):
     """Start a grid trading strategy"""
     try:
-        bot = TradingBot()
-        if bot.initialize():
-            if no_confirm:
-                bot.grid_manager._confirm_grid_strategy = lambda *args: True
+        bot = get_bot(ctx)
+        if bot:
+            bot.set_no_confirm(no_confirm)
             bot.grid_manager.execute_grid_strategy(
                 symbol.upper(), quantity_per_grid, grid_count, lower_price, upper_price, side
             )
@@ -333,53 +418,58 @@ def grid(symbol: str, quantity_per_grid: float, grid_count: int, lower_price: fl
 
 @cli.command()
 @click.option('--symbol', type=str, help='Filter by symbol')
-def orders(symbol: str):
+@click.pass_context
+def orders(ctx, symbol: str):
     """List open orders"""
     try:
-        bot = TradingBot()
-        if bot.initialize():
+        bot = get_bot(ctx)
+        if bot:
             bot.limit_manager.list_open_orders(symbol.upper() if symbol else None)
     except Exception as e:
         raise click.ClickException(str(e))
 
 @cli.command()
 @click.argument('symbol', type=str)
-def info(symbol: str):
+@click.pass_context
+def info(ctx, symbol: str):
     """Show market information for a symbol"""
     try:
-        bot = TradingBot()
-        if bot.initialize():
+        bot = get_bot(ctx)
+        if bot:
             bot.market_manager.display_market_summary(symbol.upper())
     except Exception as e:
         raise click.ClickException(str(e))
 
 @cli.command()
-def account():
+@click.pass_context
+def account(ctx):
     """Show account summary"""
     try:
-        bot = TradingBot()
-        if bot.initialize():
+        bot = get_bot(ctx)
+        if bot:
             bot.display_account_summary()
     except Exception as e:
         raise click.ClickException(str(e))
 
 @cli.command()
-def grid_list():
+@click.pass_context
+def grid_list(ctx):
     """List active grid strategies"""
     try:
-        bot = TradingBot()
-        if bot.initialize():
+        bot = get_bot(ctx)
+        if bot:
             bot.grid_manager.list_active_grids()
     except Exception as e:
         raise click.ClickException(str(e))
 
 @cli.command()
 @click.argument('grid_id', type=str)
-def grid_stop(grid_id: str):
+@click.pass_context
+def grid_stop(ctx, grid_id: str):
     """Stop a grid strategy"""
     try:
-        bot = TradingBot()
-        if bot.initialize():
+        bot = get_bot(ctx)
+        if bot:
             bot.grid_manager.stop_grid_strategy(grid_id)
     except Exception as e:
         raise click.ClickException(str(e))
@@ -387,19 +477,19 @@ def grid_stop(grid_id: str):
 @cli.command()
 def version():
     """Show version information"""
-    console.print("[bold blue]Binance Futures Trading Bot v1.0.0[/bold blue]")
-    console.print(f"Configuration: {config.binance.testnet and 'Testnet' or 'Live'}")
-    console.print(f"Log Level: {config.logging.log_level}")
+    click.secho("Binance Futures Trading Bot v1.0.0", fg="blue", bold=True)
+    click.echo(f"Configuration: {config.binance.testnet and 'Testnet' or 'Live'}")
+    click.echo(f"Log Level: {config.logging.log_level}")
 
 def main():
     """Main entry point"""
     try:
         cli()
     except KeyboardInterrupt:
-        console.print("\n[yellow]Operation cancelled by user[/yellow]")
+        _get_console().print("\n[yellow]Operation cancelled by user[/yellow]")
         sys.exit(0)
     except Exception as e:
-        console.print(f"[red]Unexpected error: {str(e)}[/red]")
+        _get_console().print(f"[red]Unexpected error: {str(e)}[/red]")
         logger.log_error(e, "main")
         sys.exit(1)
 
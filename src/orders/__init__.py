@@ -0,0 +1,13 @@
+"""
+Order execution package
+"""
+
+try:
+    from ..utils.lazy import lazy_exports
+except ImportError:
+    from utils.lazy import lazy_exports
+
+__all__, __getattr__ = lazy_exports(__name__, {
+    "MarketOrderManager": ".market_orders",
+    "LimitOrderManager": ".limit_orders",
+})
@@ -0,0 +1,14 @@
+"""
+Advanced order types implementation
+"""
+
+try:
+    from ...utils.lazy import lazy_exports
+except ImportError:
+    from utils.lazy import lazy_exports
+
+__all__, __getattr__ = lazy_exports(__name__, {
+    "OCOOrderManager": ".oco",
+    "GridTradingManager": ".grid",
+    "TWAPOrderManager": ".twap",
+})
@@ -5,11 +5,17 @@ Automated buy-low/sell-high strategy within a price range
 """
 
 import click
+import functools
 import time
 import threading
 import math
+import queue
+import uuid
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, Any, List, Optional
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -17,29 +23,109 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 import sys
 import os
 
+# Optional: JIT-compile the grid level kernel
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Add src to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 try:
-    from ...client.binance_client import BinanceFuturesClient
+    from ...client.binance_client import BinanceFuturesClient, MAX_BATCH_ORDERS, get_shared_client
     from ...client.validator import GridOrderRequest
     from ...utils.logger import logger
     from ...utils.config import config
 except ImportError:
-    from client.binance_client import BinanceFuturesClient
+    from client.binance_client import BinanceFuturesClient, MAX_BATCH_ORDERS, get_shared_client
     from client.validator import GridOrderRequest
     from utils.logger import logger
     from utils.config import config
 
 console = Console()
 
+# Concurrent batchOrders requests while placing a grid's initial orders;
+# kept small to stay well inside Binance's order rate limits
+GRID_PLACEMENT_WORKERS = 5
+
+# Grids with a stream listener are still polled this often (seconds), so a
+# fill the user-data stream dropped while reconnecting is not missed
+GRID_STREAM_CHECK_INTERVAL = 30
+
+# How long fills' counter orders are collected into one batchOrders request
+COUNTER_BATCH_WINDOW = 0.05  # seconds
+
+# Side codes in the trade columns
+_TRADE_SIDES = {'BUY': 0, 'SELL': 1}
+
+# Order type and display color per level side code
+_LEVEL_SIDES = {1: ("BUY", "green"), -1: ("SELL", "red"), 0: ("MARKET", "yellow")}
+
+def _level_ticks(lower_ticks: float, upper_ticks: float, grid_count: int,
+                 current_ticks: float):
+    """Tick count of every grid level and its side code: 1 buy (below market),
+    -1 sell (above market), 0 at the market price"""
+    price_ticks = np.rint(np.linspace(lower_ticks, upper_ticks, grid_count)).astype(np.int64)
+    sides = np.where(price_ticks < current_ticks, 1, np.where(price_ticks > current_ticks, -1, 0))
+    return price_ticks, sides
+
+if njit is not None:
+    _level_ticks = njit(cache=True)(_level_ticks)
+
+@dataclass
+class GridLevel:
+    """One price level of a grid and the state of its order"""
+    __slots__ = ('level', 'price', 'price_str', 'price_ticks', 'order_type',
+                 'side_color', 'status', 'order_id')
+    level: int
+    price: float
+    price_str: str
+    price_ticks: int
+    order_type: str
+    side_color: str
+    status: str
+    order_id: Optional[int]
+
+# (header, style) column schemas for the grid tables
+_GRID_LEVEL_COLUMNS = (
+    ("Level", "white"), ("Price", "white"), ("Order Type", "white"), ("Distance from Market", "white")
+)
+_ACTIVE_GRID_COLUMNS = (
+    ("Grid ID", "cyan"), ("Symbol", "white"), ("Levels", "white"), ("Range", "white"),
+    ("Trades", "white"), ("Profit", "green"), ("Status", "white")
+)
+
+def _make_table(columns, **kwargs) -> Table:
+    """Fresh Rich table with the given column schema"""
+    table = Table(show_header=True, **kwargs)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+@functools.lru_cache(maxsize=64)
+def _price_decimals(tick_size: float) -> int:
+    """Decimal places needed to show prices on a tick_size grid"""
+    return max(0, -int(math.floor(math.log10(tick_size))))
+
 class GridTradingManager:
     """Handles Grid Trading strategy execution"""
     
-    def __init__(self):
-        self.client = BinanceFuturesClient()
+    def __init__(self, interactive: bool = True,
+                 client: Optional[BinanceFuturesClient] = None):
+        # Callers holding a client pass it in; otherwise grids share the
+        # process-wide client and its pooled session
+        self.client = client if client is not None else get_shared_client()
+        # Non-interactive callers (e.g. the web UI) skip the confirmation prompt
+        self.interactive = interactive
         self.active_grids = {}
         self.stop_monitoring = threading.Event()
+        # Serializes fill handling between the poller and the user-data stream
+        self._fill_lock = threading.Lock()
+        # Counter orders queued by fill handlers, placed by one drain thread
+        self._counter_queue = queue.Queue()
+        self._counter_lock = threading.Lock()
+        self._counter_thread = None
     
     def execute_grid_strategy(self, symbol: str, quantity_per_grid: float,
                              grid_count: int, lower_price: float, upper_price: float,
@@ -71,19 +157,20 @@ class GridTradingManager:
             
             # Calculate grid levels
             grid_levels = self._calculate_grid_levels(
-                lower_price, upper_price, grid_count, current_price
+                symbol, lower_price, upper_price, grid_count, current_price
             )
             
             # Display grid configuration
             self._display_grid_details(validated_grid, current_price, grid_levels, base_side)
             
             # Confirm grid strategy
-            if not self._confirm_grid_strategy(validated_grid, current_price, grid_levels):
+            if self.interactive and not self._confirm_grid_strategy(validated_grid, current_price, grid_levels):
                 console.print("[red]Grid strategy cancelled by user[/red]")
                 return {"status": "CANCELLED", "reason": "User cancelled"}
             
             # Create grid execution plan
-            grid_id = f"GRID_{int(time.time())}"
+            # Random suffix so grids started in the same second don't collide
+            grid_id = f"GRID_{uuid.uuid4().hex[:10]}"
             grid_strategy = {
                 'grid_id': grid_id,
                 'symbol': symbol,
@@ -91,12 +178,22 @@ class GridTradingManager:
                 'grid_count': grid_count,
                 'lower_price': lower_price,
                 'upper_price': upper_price,
+                # Display strings, formatted once per grid
+                'range_str': f"${lower_price:,.2f} - ${upper_price:,.2f}",
+                'range_label': f"${lower_price:,.0f}-${upper_price:,.0f}",
                 'base_side': base_side,
                 'current_price': current_price,
                 'grid_levels': grid_levels,
                 'buy_orders': {},
                 'sell_orders': {},
-                'executed_trades': [],
+                # Executed trades stored column-wise; sides use _TRADE_SIDES
+                # codes and times are epoch ns, so np.asarray() on any column
+                # gives a dense array
+                'trades': {'level': [], 'side': [], 'quantity': [], 'price': [], 'time_ns': [], 'order_id': []},
+                'open_buys': {},
+                'order_levels': {},
+                'open_order_ids': set(),
+                'stop_event': threading.Event(),
                 'total_profit': 0.0,
                 'status': 'ACTIVE',
                 'start_time': datetime.now()
@@ -118,56 +215,52 @@ class GridTradingManager:
             logger.log_error(e, "execute_grid_strategy")
             raise
     
-    def _calculate_grid_levels(self, lower_price: float, upper_price: float, 
-                              grid_count: int, current_price: float) -> List[Dict[str, Any]]:
-        """Calculate grid price levels with proper tick size alignment"""
-        price_range = upper_price - lower_price
-        grid_gap = price_range / (grid_count - 1)
-        
-        # Get symbol info for tick size
+    def _get_tick_size(self, symbol: str) -> float:
+        """Price tick size for symbol from the client's cached symbol filters,
+        so grid levels follow the same tick the validator snaps orders to"""
         try:
-            symbol_info = self.client.get_symbol_info("BTCUSDT")
-            tick_size = 0.1  # Default tick size for BTCUSDT
-            
-            # Find tick size from filters
-            for filter_info in symbol_info.get('filters', []):
-                if filter_info['filterType'] == 'PRICE_FILTER':
-                    tick_size = float(filter_info['tickSize'])
-                    break
-        except:
-            tick_size = 0.1  # Fallback tick size
+            symbol_info = self.client.get_symbol_info(symbol)
+        except Exception:
+            return 0.1  # Fallback tick size when exchange info is unavailable
+        
+        for filter_info in symbol_info.get('filters', []):
+            if filter_info['filterType'] == 'PRICE_FILTER':
+                return float(filter_info['tickSize'])
+        return 0.1  # Default tick size for BTCUSDT
+    
+    def _calculate_grid_levels(self, symbol: str, lower_price: float, upper_price: float,
+                              grid_count: int, current_price: float) -> List['GridLevel']:
+        """Calculate grid price levels with proper tick size alignment"""
+        tick_size = self._get_tick_size(symbol)
         
-        levels = []
-        for i in range(grid_count):
-            raw_price = lower_price + (i * grid_gap)
-            
-            # Round to tick size
-            price = round(raw_price / tick_size) * tick_size
-            price = round(price, 1)  # Round to 1 decimal for BTCUSDT
-            
-            # Determine order type based on current price
-            if price < current_price:
-                order_type = "BUY"
-                side_color = "green"
-            elif price > current_price:
-                order_type = "SELL"  
-                side_color = "red"
-            else:
-                order_type = "MARKET"  # Current price level
-                side_color = "yellow"
-            
-            levels.append({
-                'level': i + 1,
-                'price': price,
-                'order_type': order_type,
-                'side_color': side_color,
-                'status': 'PENDING'
-            })
-        
-        return levels
+        # Space the levels in whole ticks so no float error accumulates;
+        # sides are decided in tick space too
+        price_ticks, sides = _level_ticks(
+            float(round(lower_price / tick_size)), float(round(upper_price / tick_size)),
+            grid_count, current_price / tick_size
+        )
+        # Rounding to the tick's own decimals drops float noise like x.x0000001
+        decimals = _price_decimals(tick_size)
+        prices = np.round(price_ticks * tick_size, decimals)
+        
+        return [
+            GridLevel(
+                level=i + 1,
+                price=price,
+                price_str=f"${price:,.{decimals}f}",
+                price_ticks=ticks,
+                order_type=_LEVEL_SIDES[side][0],
+                side_color=_LEVEL_SIDES[side][1],
+                status='PENDING',
+                order_id=None
+            )
+            for i, (price, ticks, side) in enumerate(
+                zip(prices.tolist(), price_ticks.tolist(), sides.tolist())
+            )
+        ]
     
     def _display_grid_details(self, grid_order: GridOrderRequest, current_price: float,
-                             grid_levels: List[Dict], base_side: str):
+                             grid_levels: List['GridLevel'], base_side: str):
         """Display grid strategy details"""
         console.print(f"\n[bold cyan]Grid Trading Strategy Configuration:[/bold cyan]")
         
@@ -189,23 +282,20 @@ class GridTradingManager:
         
         # Grid levels table
         console.print(f"\n[bold yellow]Grid Levels:[/bold yellow]")
-        grid_table = Table(show_header=True, header_style="bold blue")
-        grid_table.add_column("Level", style="white")
-        grid_table.add_column("Price", style="white")
-        grid_table.add_column("Order Type", style="white")
-        grid_table.add_column("Distance from Market", style="white")
-        
-        for level in grid_levels:
-            distance_pct = ((level['price'] - current_price) / current_price) * 100
-            distance_str = f"{distance_pct:+.2f}%"
-            
-            if level['order_type'] == 'MARKET':
+        grid_table = _make_table(_GRID_LEVEL_COLUMNS, header_style="bold blue")
+        
+        # Every level's distance from market in one pass
+        prices = np.fromiter((level.price for level in grid_levels), dtype=np.float64, count=len(grid_levels))
+        distances = np.char.mod('%+.2f%%', (prices - current_price) / current_price * 100.0).tolist()
+        
+        for level, distance_str in zip(grid_levels, distances):
+            if level.order_type == 'MARKET':
                 distance_str = "Current Price"
             
             grid_table.add_row(
-                str(level['level']),
-                f"${level['price']:,.2f}",
-                f"[{level['side_color']}]{level['order_type']}[/{level['side_color']}]",
+                str(level.level),
+                level.price_str,
+                f"[{level.side_color}]{level.order_type}[/{level.side_color}]",
                 distance_str
             )
         
@@ -221,7 +311,7 @@ class GridTradingManager:
         console.print(f"[green]Maximum potential profit: ${max_potential_profit:.2f}[/green]")
     
     def _confirm_grid_strategy(self, grid_order: GridOrderRequest, current_price: float,
-                              grid_levels: List[Dict]) -> bool:
+                              grid_levels: List['GridLevel']) -> bool:
         """Confirm grid strategy with user"""
         total_value = grid_order.grid_count * grid_order.quantity_per_grid * current_price
         
@@ -247,171 +337,337 @@ class GridTradingManager:
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console
-        ) as progress:
+        ) as progress, ThreadPoolExecutor(max_workers=GRID_PLACEMENT_WORKERS) as pool:
+            
+            grid_levels = grid_strategy['grid_levels']
+            task = progress.add_task(f"Placing grid orders for {symbol}", total=len(grid_levels))
             
-            task = progress.add_task(f"Placing grid orders for {symbol}", total=len(grid_strategy['grid_levels']))
+            # The level at the market price takes no order
+            orderable = [level for level in grid_levels if self._opens_order(level, current_price)]
+            progress.update(task, advance=len(grid_levels) - len(orderable))
             
-            for level in grid_strategy['grid_levels']:
+            # One batchOrders request per MAX_BATCH_ORDERS levels, overlapping in
+            # the pool; results are recorded on this thread
+            pending = {
+                pool.submit(self._place_grid_batch, symbol, quantity, batch): batch
+                for batch in (
+                    orderable[start:start + MAX_BATCH_ORDERS]
+                    for start in range(0, len(orderable), MAX_BATCH_ORDERS)
+                )
+            }
+            for future in as_completed(pending):
+                batch = pending[future]
                 try:
-                    price = level['price']
-                    
-                    if level['order_type'] == 'BUY' and price < current_price:
-                        # Place buy limit order
-                        order_result = self.client.place_limit_order(symbol, 'BUY', quantity, price)
-                        if order_result:
-                            grid_strategy['buy_orders'][level['level']] = order_result
-                            level['status'] = 'PLACED'
-                            level['order_id'] = order_result.get('orderId')
-                            placed_orders += 1
-                    
-                    elif level['order_type'] == 'SELL' and price > current_price:
-                        # Place sell limit order  
-                        order_result = self.client.place_limit_order(symbol, 'SELL', quantity, price)
-                        if order_result:
-                            grid_strategy['sell_orders'][level['level']] = order_result
-                            level['status'] = 'PLACED'
-                            level['order_id'] = order_result.get('orderId')
-                            placed_orders += 1
-                    
-                    progress.update(task, advance=1)
-                    time.sleep(0.1)  # Small delay to avoid rate limits
-                    
+                    results = future.result()
                 except Exception as e:
-                    logger.log_error(e, f"place_grid_order_level_{level['level']}")
-                    level['status'] = 'FAILED'
-                    continue
+                    logger.log_error(e, f"place_grid_orders_levels_{batch[0].level}-{batch[-1].level}")
+                    results = [None] * len(batch)
+                
+                for level, order_result in zip(batch, results):
+                    # Rejected legs come back as {'code': ..., 'msg': ...}
+                    if not order_result or 'code' in order_result:
+                        level.status = 'FAILED'
+                        continue
+                    self._track_order(grid_strategy, level.level, level.order_type, order_result)
+                    level.status = 'PLACED'
+                    level.order_id = order_result.get('orderId')
+                    placed_orders += 1
+                
+                progress.update(task, advance=len(batch))
         
         console.print(f"[green]✓ Placed {placed_orders} grid orders successfully[/green]")
         grid_strategy['placed_orders_count'] = placed_orders
     
+    @staticmethod
+    def _opens_order(level: 'GridLevel', current_price: float) -> bool:
+        """Whether a grid level gets an initial limit order"""
+        if level.order_type == 'BUY':
+            return level.price < current_price
+        if level.order_type == 'SELL':
+            return level.price > current_price
+        return False
+    
+    def _place_grid_batch(self, symbol: str, quantity: float,
+                          levels: List['GridLevel']) -> List[Dict[str, Any]]:
+        """Place the limit orders for up to MAX_BATCH_ORDERS levels in one request"""
+        return self.client.place_batch_orders([
+            {'symbol': symbol, 'side': level.order_type, 'quantity': quantity, 'price': level.price}
+            for level in levels
+        ])
+    
     def _start_grid_monitoring(self, grid_strategy: Dict[str, Any]):
         """Start monitoring grid strategy in background"""
         grid_id = grid_strategy['grid_id']
         self.active_grids[grid_id] = grid_strategy
         
-        # Start monitoring thread
+        # Prefer fills pushed by the user-data stream when streams are enabled;
+        # the monitor then only polls every GRID_STREAM_CHECK_INTERVAL
+        listener = functools.partial(self._on_order_update, grid_strategy)
+        if self.client.add_order_listener(listener):
+            grid_strategy['order_listener'] = listener
+            logger.info(f"Streaming fills for grid strategy {grid_id}")
+        
+        # Start monitoring thread; its first poll picks up fills that landed
+        # before the listener was registered
         monitor_thread = threading.Thread(
             target=self._monitor_grid_strategy,
             args=(grid_strategy,),
             daemon=True
         )
         monitor_thread.start()
-        
-        logger.info(f"Started monitoring grid strategy {grid_id}")
     
     def _monitor_grid_strategy(self, grid_strategy: Dict[str, Any]):
         """Monitor grid strategy execution"""
         grid_id = grid_strategy['grid_id']
-        symbol = grid_strategy['symbol']
         
         logger.info(f"Started monitoring grid strategy {grid_id}")
         
+        # Streamed grids are only sanity-checked; polled grids every 10 seconds
+        interval = GRID_STREAM_CHECK_INTERVAL if 'order_listener' in grid_strategy else 10
+        
+        # Waiting on the grid's own event lets stop_grid_strategy end the
+        # loop at once instead of after the current sleep
+        stop_event = grid_strategy['stop_event']
         while not self.stop_monitoring.is_set() and grid_strategy['status'] == 'ACTIVE':
             try:
-                # Check buy orders
-                for level, order_data in grid_strategy['buy_orders'].items():
-                    if order_data.get('status') != 'FILLED':
-                        order_status = self.client.get_order_status(symbol, order_data['orderId'])
-                        if order_status.get('status') == 'FILLED':
-                            self._handle_grid_order_fill(grid_strategy, level, 'BUY', order_status)
-                
-                # Check sell orders
-                for level, order_data in grid_strategy['sell_orders'].items():
-                    if order_data.get('status') != 'FILLED':
-                        order_status = self.client.get_order_status(symbol, order_data['orderId'])
-                        if order_status.get('status') == 'FILLED':
-                            self._handle_grid_order_fill(grid_strategy, level, 'SELL', order_status)
+                self._check_grid_orders(grid_strategy)
                 
-                time.sleep(10)  # Check every 10 seconds
+                if stop_event.wait(interval):
+                    break
                 
             except Exception as e:
                 logger.log_error(e, f"monitor_grid_strategy {grid_id}")
-                time.sleep(30)  # Wait longer on error
+                if stop_event.wait(30):  # Wait longer on error
+                    break
         
         logger.info(f"Stopped monitoring grid strategy {grid_id}")
     
+    def _track_order(self, grid_strategy: Dict[str, Any], level: int, side: str,
+                     order_result: Dict[str, Any]):
+        """Record a placed grid order as the level's open order"""
+        order_id = order_result.get('orderId')
+        grid_strategy['buy_orders' if side == 'BUY' else 'sell_orders'][level] = order_result
+        grid_strategy['order_levels'][order_id] = (level, side)
+        grid_strategy['open_order_ids'].add(order_id)
+    
+    def _check_grid_orders(self, grid_strategy: Dict[str, Any]):
+        """Poll the grid's open orders and handle the ones that filled"""
+        symbol = grid_strategy['symbol']
+        open_order_ids = grid_strategy['open_order_ids']
+        
+        # One openOrders request covers the whole grid; only orders that
+        # left the book need their own status lookup. Fills add counter
+        # orders, so the difference is taken up front
+        live_ids = {order['orderId'] for order in self.client.get_open_orders(symbol)}
+        for order_id in open_order_ids - live_ids:
+            order_status = self.client.get_order_status(symbol, order_id)
+            status = order_status.get('status')
+            if status == 'FILLED':
+                level, side = grid_strategy['order_levels'][order_id]
+                self._handle_grid_order_fill(grid_strategy, level, side, order_status)
+            elif status in ('CANCELED', 'EXPIRED', 'REJECTED'):
+                # Closed outside the grid; stop polling it
+                open_order_ids.discard(order_id)
+    
+    def _on_order_update(self, grid_strategy: Dict[str, Any], order: Optional[Dict[str, Any]]):
+        """User-data stream callback: route this grid's fills to the fill handler"""
+        # None reports a stream error; the monitor's sanity poll picks up
+        # any fill it dropped
+        if order is None or grid_strategy['status'] != 'ACTIVE' or order.get('X') != 'FILLED':
+            return
+        placed = grid_strategy['order_levels'].get(order.get('i'))
+        if placed is None:
+            return
+        
+        level, side = placed
+        self._handle_grid_order_fill(grid_strategy, level, side, {
+            'orderId': order['i'],
+            'status': 'FILLED',
+            'avgPrice': order.get('ap', 0),
+            'executedQty': order.get('z', 0)
+        })
+    
     def _handle_grid_order_fill(self, grid_strategy: Dict[str, Any], level: int, 
                                side: str, order_status: Dict[str, Any]):
         """Handle when a grid order is filled"""
         fill_price = float(order_status.get('avgPrice', 0))
         fill_qty = float(order_status.get('executedQty', 0))
         
+        # A fill can be reported by both the stream and a catch-up poll
+        orders = grid_strategy['buy_orders' if side == 'BUY' else 'sell_orders']
+        with self._fill_lock:
+            order_id = order_status.get('orderId')
+            if order_id not in grid_strategy['open_order_ids']:
+                return
+            grid_strategy['open_order_ids'].discard(order_id)
+            orders[level]['status'] = 'FILLED'
+            
+            # Record the trade; under the lock so the columns stay aligned
+            trades = grid_strategy['trades']
+            trades['level'].append(level)
+            trades['side'].append(_TRADE_SIDES[side])
+            trades['quantity'].append(fill_qty)
+            trades['price'].append(fill_price)
+            trades['time_ns'].append(time.time_ns())
+            trades['order_id'].append(order_id)
+            
+            # Pair against open buys; under the lock because the stream and
+            # drain threads can report fills at the same time
+            profit = self._calculate_grid_profit(grid_strategy, level, side, fill_price, fill_qty)
+            total_profit = grid_strategy['total_profit']
+        
         # Log the fill
         console.print(f"\n[green]🎯 Grid {side} order filled at level {level}: {fill_qty:.6f} @ ${fill_price:,.2f}[/green]")
         
-        # Record the trade
-        trade_record = {
-            'level': level,
-            'side': side,
-            'quantity': fill_qty,
-            'price': fill_price,
-            'time': datetime.now().isoformat(),
-            'order_id': order_status.get('orderId')
-        }
-        grid_strategy['executed_trades'].append(trade_record)
-        
-        # Update order status
         if side == 'BUY':
-            grid_strategy['buy_orders'][level]['status'] = 'FILLED'
             # Place corresponding sell order at higher level
             self._place_counter_order(grid_strategy, level, 'SELL')
         else:
-            grid_strategy['sell_orders'][level]['status'] = 'FILLED'
             # Place corresponding buy order at lower level
             self._place_counter_order(grid_strategy, level, 'BUY')
         
-        # Calculate profit if this completes a cycle
-        self._calculate_grid_profit(grid_strategy, trade_record)
+        if profit is not None:
+            console.print(f"[green]💰 Grid cycle profit: ${profit:.2f} (Total: ${total_profit:.2f})[/green]")
     
     def _place_counter_order(self, grid_strategy: Dict[str, Any], filled_level: int, side: str):
-        """Place counter order after a fill"""
-        try:
-            symbol = grid_strategy['symbol']
-            quantity = grid_strategy['quantity_per_grid']
-            
-            # Find appropriate level for counter order
-            if side == 'SELL' and filled_level < len(grid_strategy['grid_levels']):
-                # Place sell order at next higher level
-                target_level = filled_level + 1
-                if target_level <= len(grid_strategy['grid_levels']):
-                    price = grid_strategy['grid_levels'][target_level - 1]['price']
-                    order_result = self.client.place_limit_order(symbol, 'SELL', quantity, price)
-                    if order_result:
-                        grid_strategy['sell_orders'][target_level] = order_result
-                        console.print(f"[dim]Placed counter SELL order at level {target_level}: ${price:,.2f}[/dim]")
+        """Queue the counter order for a fill; the drain thread places it"""
+        # Find appropriate level for counter order: a filled buy is
+        # countered one level higher, a filled sell one level lower
+        target_level = filled_level + 1 if side == 'SELL' else filled_level - 1
+        if not 1 <= target_level <= len(grid_strategy['grid_levels']):
+            return
+        
+        self._counter_queue.put((grid_strategy, target_level, side))
+        with self._counter_lock:
+            if self._counter_thread is None:
+                self._counter_thread = threading.Thread(target=self._drain_counter_orders, daemon=True)
+                self._counter_thread.start()
+    
+    def _drain_counter_orders(self):
+        """Collect counter orders for up to COUNTER_BATCH_WINDOW seconds, then
+        place them in one batchOrders request.
+        
+        Exits on stop_monitoring, or once idle with no active grid left;
+        _place_counter_order starts a new drain thread when needed.
+        """
+        while not self.stop_monitoring.is_set():
+            try:
+                batch = [self._counter_queue.get(timeout=1.0)]
+            except queue.Empty:
+                with self._counter_lock:
+                    if self._counter_queue.empty() and not any(
+                        grid['status'] == 'ACTIVE' for grid in list(self.active_grids.values())
+                    ):
+                        self._counter_thread = None
+                        return
+                continue
+            deadline = time.monotonic() + COUNTER_BATCH_WINDOW
+            while len(batch) < MAX_BATCH_ORDERS:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._counter_queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
             
-            elif side == 'BUY' and filled_level > 1:
-                # Place buy order at next lower level
-                target_level = filled_level - 1
-                if target_level >= 1:
-                    price = grid_strategy['grid_levels'][target_level - 1]['price']
-                    order_result = self.client.place_limit_order(symbol, 'BUY', quantity, price)
-                    if order_result:
-                        grid_strategy['buy_orders'][target_level] = order_result
-                        console.print(f"[dim]Placed counter BUY order at level {target_level}: ${price:,.2f}[/dim]")
+            self._flush_counter_orders(batch)
         
+        # Shutting down: nothing new is placed, but say what was dropped
+        with self._counter_lock:
+            self._counter_thread = None
+            while True:
+                try:
+                    _, target_level, side = self._counter_queue.get_nowait()
+                except queue.Empty:
+                    break
+                logger.warning(f"Dropped queued counter {side} order for level {target_level} on shutdown")
+    
+    def _flush_counter_orders(self, batch: List[tuple]):
+        """Place a batch of queued (grid_strategy, target_level, side) counter orders"""
+        # Grids stopped while their counter order was queued are skipped
+        batch = [entry for entry in batch if entry[0]['status'] == 'ACTIVE']
+        if not batch:
+            return
+        
+        try:
+            results = self.client.place_batch_orders([
+                {
+                    'symbol': grid_strategy['symbol'],
+                    'side': side,
+                    'quantity': grid_strategy['quantity_per_grid'],
+                    'price': grid_strategy['grid_levels'][target_level - 1].price
+                }
+                for grid_strategy, target_level, side in batch
+            ])
         except Exception as e:
-            logger.log_error(e, f"place_counter_order {side} level {filled_level}")
+            for _, target_level, side in batch:
+                logger.log_error(e, f"place_counter_order {side} level {target_level}")
+            return
+        
+        # stop_grid_strategy flips the status under the same lock, so an
+        # order is either tracked (and cancelled by the stop) or orphaned here
+        placed, orphaned = [], []
+        with self._fill_lock:
+            for (grid_strategy, target_level, side), order_result in zip(batch, results):
+                # Rejected legs are logged by the client
+                if 'code' in order_result:
+                    continue
+                if grid_strategy['status'] == 'ACTIVE':
+                    self._track_order(grid_strategy, target_level, side, order_result)
+                    placed.append((grid_strategy, target_level, side))
+                else:
+                    orphaned.append((grid_strategy['symbol'], order_result.get('orderId')))
+        
+        for grid_strategy, target_level, side in placed:
+            price_str = grid_strategy['grid_levels'][target_level - 1].price_str
+            console.print(f"[dim]Placed counter {side} order at level {target_level}: {price_str}[/dim]")
+        
+        # The grid was stopped while the batch was in flight
+        for symbol, order_id in orphaned:
+            try:
+                self.client.cancel_order(symbol, order_id)
+            except Exception as e:
+                logger.log_error(e, f"cancel_counter_order {order_id}")
+        
+        # A counter order can fill before _track_order maps its id, and the
+        # stream event for it is then dropped by _on_order_update; streamed
+        # grids are only polled every GRID_STREAM_CHECK_INTERVAL, so re-check
+        # them once here
+        streamed = {id(grid_strategy): grid_strategy for grid_strategy, _, _ in placed
+                    if 'order_listener' in grid_strategy}
+        for grid_strategy in streamed.values():
+            try:
+                self._check_grid_orders(grid_strategy)
+            except Exception as e:
+                logger.log_error(e, f"check_grid_orders {grid_strategy['grid_id']}")
     
-    def _calculate_grid_profit(self, grid_strategy: Dict[str, Any], trade_record: Dict[str, Any]):
-        """Calculate profit from completed grid cycles"""
-        # Simple profit calculation - can be enhanced
-        if len(grid_strategy['executed_trades']) >= 2:
-            # Look for buy-sell pairs
-            recent_trades = grid_strategy['executed_trades'][-10:]  # Last 10 trades
-            
-            for buy_trade in recent_trades:
-                if buy_trade['side'] == 'BUY':
-                    for sell_trade in recent_trades:
-                        if (sell_trade['side'] == 'SELL' and 
-                            sell_trade['price'] > buy_trade['price'] and
-                            sell_trade['level'] > buy_trade['level']):
-                            
-                            profit = (sell_trade['price'] - buy_trade['price']) * min(buy_trade['quantity'], sell_trade['quantity'])
-                            grid_strategy['total_profit'] += profit
-                            
-                            console.print(f"[green]💰 Grid cycle profit: ${profit:.2f} (Total: ${grid_strategy['total_profit']:.2f})[/green]")
-                            break
+    def _calculate_grid_profit(self, grid_strategy: Dict[str, Any], level: int, side: str,
+                               price: float, quantity: float) -> Optional[float]:
+        """Calculate profit from completed grid cycles; call with _fill_lock held.
+        
+        Buy fills stay open by level until a sell closes them; a sell is
+        paired with the buy one level below it (its counter order), else
+        the nearest open buy below, so each buy is counted once. Returns the
+        cycle's profit, or None when the fill closes no cycle.
+        """
+        open_buys = grid_strategy['open_buys']
+        
+        if side == 'BUY':
+            open_buys[level] = (price, quantity)
+            return None
+        
+        buy = open_buys.pop(level - 1, None)
+        if buy is None:
+            lower_levels = [buy_level for buy_level in open_buys if buy_level < level]
+            if not lower_levels:
+                return None
+            buy = open_buys.pop(max(lower_levels))
+        
+        buy_price, buy_quantity = buy
+        profit = (price - buy_price) * min(buy_quantity, quantity)
+        grid_strategy['total_profit'] += profit
+        return profit
     
     def _display_grid_started(self, grid_strategy: Dict[str, Any]):
         """Display grid strategy started message"""
@@ -421,7 +677,7 @@ class GridTradingManager:
 Grid ID: {grid_strategy['grid_id']}
 Symbol: {grid_strategy['symbol']}
 Grid Levels: {grid_strategy['grid_count']}
-Price Range: ${grid_strategy['lower_price']:,.2f} - ${grid_strategy['upper_price']:,.2f}
+Price Range: {grid_strategy['range_str']}
 Orders Placed: {grid_strategy['placed_orders_count']}
 
 Grid trading is now active and monitoring for opportunities...
@@ -435,22 +691,15 @@ Grid trading is now active and monitoring for opportunities...
             console.print("[yellow]No active grid strategies found[/yellow]")
             return {}
         
-        table = Table(title="Active Grid Strategies", show_header=True, header_style="bold blue")
-        table.add_column("Grid ID", style="cyan")
-        table.add_column("Symbol", style="white")
-        table.add_column("Levels", style="white")
-        table.add_column("Range", style="white")
-        table.add_column("Trades", style="white")
-        table.add_column("Profit", style="green")
-        table.add_column("Status", style="white")
+        table = _make_table(_ACTIVE_GRID_COLUMNS, title="Active Grid Strategies", header_style="bold blue")
         
         for grid_id, grid_data in self.active_grids.items():
             table.add_row(
                 grid_id,
                 grid_data['symbol'],
                 str(grid_data['grid_count']),
-                f"${grid_data['lower_price']:,.0f}-${grid_data['upper_price']:,.0f}",
-                str(len(grid_data['executed_trades'])),
+                grid_data['range_label'],
+                str(len(grid_data['trades']['level'])),
                 f"${grid_data['total_profit']:.2f}",
                 grid_data['status']
             )
@@ -468,29 +717,27 @@ Grid trading is now active and monitoring for opportunities...
             grid_data = self.active_grids[grid_id]
             symbol = grid_data['symbol']
             
+            # Update status first: once it is set under the fill lock, the
+            # drain thread cancels any counter order still in flight instead
+            # of tracking it, so the set below is final
+            with self._fill_lock:
+                grid_data['status'] = 'STOPPED'
+            grid_data['stop_event'].set()
+            listener = grid_data.pop('order_listener', None)
+            if listener is not None:
+                self.client.remove_order_listener(listener)
+            
             # Cancel all pending orders
             cancelled_count = 0
             
-            # Cancel buy orders
-            for level, order_data in grid_data['buy_orders'].items():
-                if order_data.get('status') != 'FILLED':
-                    try:
-                        self.client.cancel_order(symbol, order_data['orderId'])
-                        cancelled_count += 1
-                    except:
-                        pass
-            
-            # Cancel sell orders
-            for level, order_data in grid_data['sell_orders'].items():
-                if order_data.get('status') != 'FILLED':
-                    try:
-                        self.client.cancel_order(symbol, order_data['orderId'])
-                        cancelled_count += 1
-                    except:
-                        pass
+            for order_id in list(grid_data['open_order_ids']):
+                try:
+                    self.client.cancel_order(symbol, order_id)
+                    grid_data['open_order_ids'].discard(order_id)
+                    cancelled_count += 1
+                except:
+                    pass
             
-            # Update status
-            grid_data['status'] = 'STOPPED'
             grid_data['end_time'] = datetime.now()
             
             console.print(f"[green]Grid strategy {grid_id} stopped successfully[/green]")
@@ -523,11 +770,7 @@ def grid_strategy(symbol: str, quantity_per_grid: float, grid_count: int,
         python grid.py ETHUSDT 0.01 15 4000 4300 --side BUY_ONLY
     """
     try:
-        manager = GridTradingManager()
-        
-        # Override confirmation if flag is set
-        if no_confirm:
-            manager._confirm_grid_strategy = lambda *args: True
+        manager = GridTradingManager(interactive=not no_confirm)
         
         # Execute grid strategy
         result = manager.execute_grid_strategy(
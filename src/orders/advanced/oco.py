@@ -5,10 +5,14 @@ Combines take-profit and stop-loss orders for risk management
 """
 
 import click
+import functools
+import itertools
+import random
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -19,25 +23,65 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 try:
-    from ...client.binance_client import BinanceFuturesClient
+    from ...client.binance_client import BinanceFuturesClient, get_shared_client
     from ...client.validator import OCOOrderRequest
     from ...utils.logger import logger
     from ...utils.config import config
 except ImportError:
-    from client.binance_client import BinanceFuturesClient
+    from client.binance_client import BinanceFuturesClient, get_shared_client
     from client.validator import OCOOrderRequest
     from utils.logger import logger
     from utils.config import config
 
 console = Console()
 
+OCO_POLL_INTERVAL = 5
+MAX_POLL_BACKOFF = 60
+
+# OCOs with a stream listener are still polled this often (seconds), so a
+# fill the user-data stream dropped while reconnecting is not missed
+OCO_STREAM_CHECK_INTERVAL = 30
+
+# OCO ids are unique per process even when several are placed in one second
+_oco_sequence = itertools.count(1)
+
+def _poll_backoff(failures: int, error: Exception) -> float:
+    """Seconds to wait after consecutive failed polls.
+    
+    Doubles from twice the poll interval up to MAX_POLL_BACKOFF, with up to a
+    second of jitter so monitors in several processes don't retry in step.
+    A rate-limit response (429, or 418 once banned) waits at least its Retry-After.
+    """
+    delay = min(MAX_POLL_BACKOFF, OCO_POLL_INTERVAL * 2 ** failures) + random.random()
+    response = getattr(error, 'response', None)
+    if getattr(error, 'status_code', None) in (418, 429) and response is not None:
+        try:
+            delay = max(delay, float(response.headers.get('Retry-After', 0)))
+        except (TypeError, ValueError):
+            pass
+    return delay
+
 class OCOOrderManager:
     """Handles OCO (One-Cancels-Other) order operations"""
     
-    def __init__(self):
-        self.client = BinanceFuturesClient()
+    def __init__(self, interactive: bool = True,
+                 client: Optional[BinanceFuturesClient] = None):
+        # Default to the process-wide client so its pooled session is reused
+        self.client = client if client is not None else get_shared_client()
+        # Non-interactive callers (e.g. the web UI) skip the confirmation prompt
+        self.interactive = interactive
+        # Written from callers, the monitor thread and stream callbacks; every
+        # write and every iteration goes through _orders_lock
         self.monitoring_orders = {}
         self.stop_monitoring = threading.Event()
+        # Serialises OCO completion between the stream callback and a poll
+        self._fill_lock = threading.Lock()
+        # Also guards the polling thread
+        self._orders_lock = threading.Lock()
+        self._monitor_thread: Optional[threading.Thread] = None
+        # Stream callbacks hand their REST calls (cancels, re-checks) to this
+        # worker so the websocket thread never waits on the API
+        self._stream_worker = ThreadPoolExecutor(max_workers=1)
     
     def execute_oco_order(self, symbol: str, side: str, quantity: float,
                          price: float, stop_price: float, 
@@ -61,11 +105,13 @@ class OCOOrderManager:
             # Get current market price
             current_price = self.client.get_current_price(symbol)
             
-            # Display OCO order details
-            self._display_oco_details(validated_oco, current_price)
+            # Display OCO order details; the table is only worth building
+            # for someone at a terminal who is about to confirm
+            if self.interactive and console.is_terminal:
+                self._display_oco_details(validated_oco, current_price)
             
             # Confirm order
-            if not self._confirm_oco_order(validated_oco, current_price):
+            if self.interactive and not self._confirm_oco_order(validated_oco, current_price):
                 console.print("[red]OCO order cancelled by user[/red]")
                 return {"status": "CANCELLED", "reason": "User cancelled"}
             
@@ -76,30 +122,30 @@ class OCOOrderManager:
             stop_order_result = None
             
             try:
-                # Place limit order (take profit)
-                with console.status("[bold green]Placing limit order..."):
-                    limit_order_result = self.client.place_limit_order(
-                        symbol, side, quantity, price
-                    )
-                
-                console.print(f"[green]✓ Limit order placed: {limit_order_result.get('orderId')}[/green]")
-                
-                # Place stop order (stop loss)
-                with console.status("[bold yellow]Placing stop order..."):
-                    if stop_limit_price:
-                        stop_order_result = self.client.place_stop_limit_order(
-                            symbol, side, quantity, stop_price, stop_limit_price
+                # The legs are independent, so both requests go out at once
+                with console.status("[bold green]Placing limit and stop orders..."):
+                    with ThreadPoolExecutor(max_workers=2) as executor:
+                        limit_future = executor.submit(
+                            self.client.place_limit_order, symbol, side, quantity, price
                         )
-                    else:
-                        # Use stop market order if no stop limit price provided
-                        stop_order_result = self._place_stop_market_order(
-                            symbol, side, quantity, stop_price
+                        stop_future = executor.submit(
+                            self._place_stop_order, symbol, side, quantity,
+                            stop_price, stop_limit_price
                         )
                 
+                # Keep whichever leg landed so a failure of the other cleans it up
+                if limit_future.exception() is None:
+                    limit_order_result = limit_future.result()
+                if stop_future.exception() is None:
+                    stop_order_result = stop_future.result()
+                limit_future.result()
+                stop_future.result()
+                
+                console.print(f"[green]✓ Limit order placed: {limit_order_result.get('orderId')}[/green]")
                 console.print(f"[green]✓ Stop order placed: {stop_order_result.get('orderId')}[/green]")
                 
                 # Create OCO tracking entry
-                oco_id = f"OCO_{int(time.time())}"
+                oco_id = f"OCO_{os.getpid()}_{next(_oco_sequence)}"
                 oco_result = {
                     'oco_id': oco_id,
                     'symbol': symbol,
@@ -108,7 +154,13 @@ class OCOOrderManager:
                     'limit_order': limit_order_result,
                     'stop_order': stop_order_result,
                     'status': 'ACTIVE',
-                    'created_time': time.time()
+                    'created_time': time.time(),
+                    # Formatted once; list_active_oco_orders only appends the status
+                    'table_row': (
+                        oco_id, symbol, side, f"{quantity:.6f}",
+                        str(limit_order_result.get('orderId')),
+                        str(stop_order_result.get('orderId'))
+                    )
                 }
                 
                 # Start monitoring
@@ -129,6 +181,16 @@ class OCOOrderManager:
             logger.log_error(e, "execute_oco_order")
             raise
     
+    def _place_stop_order(self, symbol: str, side: str, quantity: float, stop_price: float,
+                          stop_limit_price: Optional[float]) -> Dict[str, Any]:
+        """Place the stop-loss leg"""
+        if stop_limit_price:
+            return self.client.place_stop_limit_order(
+                symbol, side, quantity, stop_price, stop_limit_price
+            )
+        # Use stop market order if no stop limit price provided
+        return self._place_stop_market_order(symbol, side, quantity, stop_price)
+    
     def _place_stop_market_order(self, symbol: str, side: str, quantity: float, stop_price: float) -> Dict[str, Any]:
         """Place a stop market order (fallback for when stop-limit not available)"""
         # Note: This is a simplified implementation
@@ -137,8 +199,6 @@ class OCOOrderManager:
     
     def _display_oco_details(self, oco_order: OCOOrderRequest, current_price: float):
         """Display OCO order details"""
-        console.print(f"\n[bold cyan]OCO Order Configuration:[/bold cyan]")
-        
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Parameter", style="cyan")
         table.add_column("Value", style="white")
@@ -155,18 +215,22 @@ class OCOOrderManager:
         if oco_order.stop_limit_price:
             table.add_row("Stop Limit", f"${oco_order.stop_limit_price:,.2f}", "Stop loss execution price")
         
-        console.print(table)
+        parts = ["\n[bold cyan]OCO Order Configuration:[/bold cyan]", table]
         
-        # Calculate potential profit/loss
-        if oco_order.side == 'SELL':
-            profit_pct = ((oco_order.price - current_price) / current_price) * 100
-            loss_pct = ((oco_order.stop_price - current_price) / current_price) * 100
-        else:
-            profit_pct = ((current_price - oco_order.price) / oco_order.price) * 100
-            loss_pct = ((current_price - oco_order.stop_price) / oco_order.stop_price) * 100
+        # Calculate potential profit/loss; no market price means nothing to compare
+        if current_price > 0:
+            if oco_order.side == 'SELL':
+                profit_pct = ((oco_order.price - current_price) / current_price) * 100
+                loss_pct = ((oco_order.stop_price - current_price) / current_price) * 100
+            else:
+                profit_pct = ((current_price - oco_order.price) / oco_order.price) * 100
+                loss_pct = ((current_price - oco_order.stop_price) / oco_order.stop_price) * 100
+            
+            parts.append(f"\n[green]Potential Profit: {profit_pct:+.2f}%[/green]")
+            parts.append(f"[red]Potential Loss: {loss_pct:+.2f}%[/red]")
         
-        console.print(f"\n[green]Potential Profit: {profit_pct:+.2f}%[/green]")
-        console.print(f"[red]Potential Loss: {loss_pct:+.2f}%[/red]")
+        # One print renders the whole block in a single pass
+        console.print(Group(*parts))
     
     def _confirm_oco_order(self, oco_order: OCOOrderRequest, current_price: float) -> bool:
         """Confirm OCO order with user"""
@@ -181,6 +245,15 @@ class OCOOrderManager:
     
     def _display_oco_result(self, oco_result: Dict[str, Any]):
         """Display OCO order execution results"""
+        if not console.is_terminal:
+            logger.info(
+                f"OCO {oco_result['oco_id']} placed: {oco_result['side']} "
+                f"{oco_result['quantity']} {oco_result['symbol']} "
+                f"(limit {oco_result['limit_order'].get('orderId')}, "
+                f"stop {oco_result['stop_order'].get('orderId')})"
+            )
+            return
+        
         content = f"""
 [bold green]✓ OCO Orders Placed Successfully[/bold green]
 
@@ -200,66 +273,153 @@ Status: Monitoring for execution...
     def _start_oco_monitoring(self, oco_result: Dict[str, Any]):
         """Start monitoring OCO orders in background thread"""
         oco_id = oco_result['oco_id']
-        self.monitoring_orders[oco_id] = oco_result
+        with self._orders_lock:
+            self.monitoring_orders[oco_id] = oco_result
         
-        # Start monitoring thread
-        monitor_thread = threading.Thread(
-            target=self._monitor_oco_order,
-            args=(oco_result,),
-            daemon=True
-        )
-        monitor_thread.start()
+        # Prefer fills pushed by the user-data stream when streams are enabled;
+        # the poller then only checks the OCO every OCO_STREAM_CHECK_INTERVAL
+        listener = functools.partial(self._on_order_update, oco_result)
+        if self.client.add_order_listener(listener):
+            oco_result['order_listener'] = listener
+            oco_result['next_check'] = time.monotonic() + OCO_STREAM_CHECK_INTERVAL
+            try:
+                # Pick up a leg that filled before the listener was registered
+                self._check_oco_orders(oco_result)
+            except Exception as e:
+                logger.log_error(e, f"check_oco_orders {oco_id}")
+            console.print(f"[dim]Streaming fills for OCO {oco_id}[/dim]")
+        
+        # Hand the OCO to the shared polling thread, starting it if idle
+        with self._orders_lock:
+            if self._monitor_thread is None:
+                self._monitor_thread = threading.Thread(
+                    target=self._monitor_oco_orders,
+                    daemon=True
+                )
+                self._monitor_thread.start()
         
-        console.print(f"[dim]Started monitoring OCO {oco_id}[/dim]")
+        if 'order_listener' not in oco_result:
+            console.print(f"[dim]Started monitoring OCO {oco_id}[/dim]")
     
-    def _monitor_oco_order(self, oco_result: Dict[str, Any]):
-        """Monitor OCO order execution"""
-        oco_id = oco_result['oco_id']
+    def _monitor_oco_orders(self):
+        """Poll every OCO until none are left; streamed OCOs only once they
+        are due for their sanity check"""
+        logger.info("Started OCO monitor")
+        
+        failures = 0
+        while not self.stop_monitoring.is_set():
+            now = time.monotonic()
+            with self._orders_lock:
+                if not self.monitoring_orders:
+                    self._monitor_thread = None
+                    break
+                polled = [oco_result for oco_result in self.monitoring_orders.values()
+                          if oco_result.get('next_check', 0) <= now]
+            
+            error = None
+            for oco_result in polled:
+                if 'order_listener' in oco_result:
+                    oco_result['next_check'] = now + OCO_STREAM_CHECK_INTERVAL
+                try:
+                    self._check_oco_orders(oco_result)
+                except Exception as e:
+                    logger.log_error(e, f"monitor_oco_order {oco_result['oco_id']}")
+                    error = e
+            
+            # Back off while polls keep failing so an outage isn't hammered
+            if error is None:
+                failures = 0
+                delay = OCO_POLL_INTERVAL
+            else:
+                failures += 1
+                delay = _poll_backoff(failures, error)
+            
+            # Waiting on the event lets a shutdown end the loop at once
+            if self.stop_monitoring.wait(delay):
+                break
+        
+        logger.info("Stopped OCO monitor")
+    
+    def _check_oco_orders(self, oco_result: Dict[str, Any]):
+        """Poll both legs and resolve the OCO if either has filled"""
         symbol = oco_result['symbol']
         limit_order_id = oco_result['limit_order'].get('orderId')
         stop_order_id = oco_result['stop_order'].get('orderId')
         
-        logger.info(f"Started monitoring OCO {oco_id}")
+        # One openOrders request covers both legs; a leg only needs its own
+        # status lookup once it has left the book
+        live_orders = {order['orderId']: order for order in self.client.get_open_orders(symbol)}
+        if limit_order_id in live_orders and stop_order_id in live_orders:
+            return
+        limit_status = (live_orders.get(limit_order_id)
+                        or self.client.get_order_status(symbol, limit_order_id))
+        stop_status = (live_orders.get(stop_order_id)
+                       or self.client.get_order_status(symbol, stop_order_id))
         
-        while not self.stop_monitoring.is_set():
-            try:
-                # Check limit order status
-                limit_status = self.client.get_order_status(symbol, limit_order_id)
-                stop_status = self.client.get_order_status(symbol, stop_order_id)
-                
-                # Check if either order is filled
-                if limit_status.get('status') == 'FILLED':
-                    # Limit order filled - cancel stop order
-                    console.print(f"\n[green]🎯 Take profit hit for OCO {oco_id}![/green]")
-                    self._cancel_remaining_order(symbol, stop_order_id, "stop order")
-                    oco_result['status'] = 'LIMIT_FILLED'
-                    break
-                
-                elif stop_status.get('status') == 'FILLED':
-                    # Stop order filled - cancel limit order
-                    console.print(f"\n[red]🛑 Stop loss triggered for OCO {oco_id}![/red]")
-                    self._cancel_remaining_order(symbol, limit_order_id, "limit order")
-                    oco_result['status'] = 'STOP_FILLED'
-                    break
-                
-                elif (limit_status.get('status') == 'CANCELED' and 
-                      stop_status.get('status') == 'CANCELED'):
-                    # Both orders cancelled
-                    console.print(f"\n[yellow]OCO {oco_id} cancelled[/yellow]")
-                    oco_result['status'] = 'CANCELLED'
-                    break
-                
-                time.sleep(5)  # Check every 5 seconds
-                
-            except Exception as e:
-                logger.log_error(e, f"monitor_oco_order {oco_id}")
-                time.sleep(10)  # Wait longer on error
+        # Check if either order is filled
+        if limit_status.get('status') == 'FILLED':
+            self._complete_oco(oco_result, 'LIMIT_FILLED')
+        elif stop_status.get('status') == 'FILLED':
+            self._complete_oco(oco_result, 'STOP_FILLED')
+        elif (limit_status.get('status') == 'CANCELED' and 
+              stop_status.get('status') == 'CANCELED'):
+            self._complete_oco(oco_result, 'CANCELLED')
+    
+    def _on_order_update(self, oco_result: Dict[str, Any], order: Optional[Dict[str, Any]]):
+        """User-data stream callback: resolve the OCO when one of its legs fills.
         
-        # Remove from monitoring
-        if oco_id in self.monitoring_orders:
-            del self.monitoring_orders[oco_id]
+        Runs on the websocket thread, so the REST work goes to _stream_worker.
+        """
+        if oco_result['status'] != 'ACTIVE':
+            return
+        if order is None:
+            # Stream error: fills may have been dropped, check both legs now
+            self._stream_worker.submit(self._recheck_oco, oco_result)
+            return
+        if order.get('X') != 'FILLED':
+            return
+        order_id = order.get('i')
+        if order_id == oco_result['limit_order'].get('orderId'):
+            self._stream_worker.submit(self._complete_oco, oco_result, 'LIMIT_FILLED')
+        elif order_id == oco_result['stop_order'].get('orderId'):
+            self._stream_worker.submit(self._complete_oco, oco_result, 'STOP_FILLED')
+    
+    def _recheck_oco(self, oco_result: Dict[str, Any]):
+        """Poll an OCO after a stream error, logging rather than raising"""
+        try:
+            self._check_oco_orders(oco_result)
+        except Exception as e:
+            logger.log_error(e, f"check_oco_orders {oco_result['oco_id']}")
+    
+    def _complete_oco(self, oco_result: Dict[str, Any], status: str):
+        """Cancel the surviving leg and stop tracking the OCO"""
+        # A fill can be reported by both the stream and a catch-up poll
+        with self._fill_lock:
+            if oco_result['status'] != 'ACTIVE':
+                return
+            oco_result['status'] = status
+        
+        oco_id = oco_result['oco_id']
+        symbol = oco_result['symbol']
+        if status == 'LIMIT_FILLED':
+            # Limit order filled - cancel stop order
+            console.print(f"\n[green]🎯 Take profit hit for OCO {oco_id}![/green]")
+            self._cancel_remaining_order(symbol, oco_result['stop_order'].get('orderId'), "stop order")
+        elif status == 'STOP_FILLED':
+            # Stop order filled - cancel limit order
+            console.print(f"\n[red]🛑 Stop loss triggered for OCO {oco_id}![/red]")
+            self._cancel_remaining_order(symbol, oco_result['limit_order'].get('orderId'), "limit order")
+        else:
+            # Both orders cancelled
+            console.print(f"\n[yellow]OCO {oco_id} cancelled[/yellow]")
         
-        logger.info(f"Stopped monitoring OCO {oco_id}")
+        listener = oco_result.pop('order_listener', None)
+        if listener is not None:
+            self.client.remove_order_listener(listener)
+        
+        # Remove from monitoring
+        with self._orders_lock:
+            self.monitoring_orders.pop(oco_id, None)
     
     def _cancel_remaining_order(self, symbol: str, order_id: int, order_type: str):
         """Cancel the remaining order when one leg of OCO is filled"""
@@ -271,23 +431,27 @@ Status: Monitoring for execution...
     
     def _cleanup_failed_oco(self, limit_order: Optional[Dict], stop_order: Optional[Dict], symbol: str):
         """Clean up orders if OCO placement fails"""
-        if limit_order and limit_order.get('orderId'):
-            try:
-                self.client.cancel_order(symbol, limit_order['orderId'])
-                console.print(f"[yellow]Cancelled limit order {limit_order['orderId']} due to error[/yellow]")
-            except:
-                pass
+        placed = [(order['orderId'], order_type)
+                  for order, order_type in ((limit_order, "limit"), (stop_order, "stop"))
+                  if order and order.get('orderId')]
+        if not placed:
+            return
         
-        if stop_order and stop_order.get('orderId'):
-            try:
-                self.client.cancel_order(symbol, stop_order['orderId'])
-                console.print(f"[yellow]Cancelled stop order {stop_order['orderId']} due to error[/yellow]")
-            except:
-                pass
+        # Whatever landed is cancelled in one request
+        try:
+            results = self.client.cancel_orders(symbol, [order_id for order_id, _ in placed])
+        except:
+            return
+        for (order_id, order_type), result in zip(placed, results):
+            if 'code' not in result:
+                console.print(f"[yellow]Cancelled {order_type} order {order_id} due to error[/yellow]")
     
     def list_active_oco_orders(self) -> Dict[str, Any]:
         """List all active OCO orders"""
-        if not self.monitoring_orders:
+        with self._orders_lock:
+            active_orders = dict(self.monitoring_orders)
+        
+        if not active_orders:
             console.print("[yellow]No active OCO orders found[/yellow]")
             return {}
         
@@ -300,36 +464,39 @@ Status: Monitoring for execution...
         table.add_column("Stop Order", style="red")
         table.add_column("Status", style="white")
         
-        for oco_id, oco_data in self.monitoring_orders.items():
-            table.add_row(
-                oco_id,
-                oco_data['symbol'],
-                oco_data['side'],
-                f"{oco_data['quantity']:.6f}",
-                str(oco_data['limit_order'].get('orderId')),
-                str(oco_data['stop_order'].get('orderId')),
-                oco_data['status']
-            )
+        for oco_data in active_orders.values():
+            table.add_row(*oco_data['table_row'], oco_data['status'])
         
         console.print(table)
-        return self.monitoring_orders
+        return active_orders
     
     def cancel_oco_order(self, oco_id: str) -> bool:
         """Cancel a specific OCO order"""
-        if oco_id not in self.monitoring_orders:
+        with self._orders_lock:
+            oco_data = self.monitoring_orders.get(oco_id)
+        if oco_data is None:
             console.print(f"[red]OCO order {oco_id} not found[/red]")
             return False
         
-        oco_data = self.monitoring_orders[oco_id]
         symbol = oco_data['symbol']
         
         try:
-            # Cancel both orders
-            self.client.cancel_order(symbol, oco_data['limit_order']['orderId'])
-            self.client.cancel_order(symbol, oco_data['stop_order']['orderId'])
+            # Cancel both orders in one request
+            results = self.client.cancel_orders(
+                symbol, [oco_data['limit_order']['orderId'], oco_data['stop_order']['orderId']]
+            )
+            rejected = [result for result in results if 'code' in result]
+            if rejected:
+                console.print(f"[red]Error cancelling OCO order: {rejected[0].get('msg')}[/red]")
+                return False
             
             # Update status
             oco_data['status'] = 'CANCELLED'
+            listener = oco_data.pop('order_listener', None)
+            if listener is not None:
+                self.client.remove_order_listener(listener)
+            with self._orders_lock:
+                self.monitoring_orders.pop(oco_id, None)
             
             console.print(f"[green]OCO order {oco_id} cancelled successfully[/green]")
             return True
@@ -358,11 +525,7 @@ def oco_order(symbol: str, side: str, quantity: float, limit_price: float,
         python oco.py ETHUSDT BUY 0.1 2900 3100 --stop-limit 3110
     """
     try:
-        manager = OCOOrderManager()
-        
-        # Override confirmation if flag is set
-        if no_confirm:
-            manager._confirm_oco_order = lambda *args: True
+        manager = OCOOrderManager(interactive=not no_confirm)
         
         # Execute OCO order
         result = manager.execute_oco_order(
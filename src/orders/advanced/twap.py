@@ -9,7 +9,7 @@ import time
 import threading
 import schedule
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -36,8 +36,12 @@ console = Console()
 class TWAPOrderManager:
     """Handles TWAP (Time-Weighted Average Price) order execution"""
     
-    def __init__(self):
-        self.client = BinanceFuturesClient()
+    def __init__(self, interactive: bool = True,
+                 client: Optional[BinanceFuturesClient] = None):
+        # Callers holding a client pass it in so its pooled session is reused
+        self.client = client if client is not None else BinanceFuturesClient()
+        # Non-interactive callers (e.g. the web UI) skip the confirmation prompt
+        self.interactive = interactive
         self.active_twap_orders = {}
         self.stop_scheduler = threading.Event()
     
@@ -74,7 +78,7 @@ class TWAPOrderManager:
             self._display_twap_details(validated_twap, chunk_size, num_chunks, price_limit)
             
             # Confirm order
-            if not self._confirm_twap_order(validated_twap, chunk_size, num_chunks):
+            if self.interactive and not self._confirm_twap_order(validated_twap, chunk_size, num_chunks):
                 console.print("[red]TWAP order cancelled by user[/red]")
                 return {"status": "CANCELLED", "reason": "User cancelled"}
             
@@ -180,6 +184,12 @@ class TWAPOrderManager:
         
         console.print(f"\n[green]🕒 TWAP execution started for {twap_id}[/green]")
         
+        # Full-size chunks are identical orders, so validate them once
+        try:
+            chunk_order = self.client.prepare_order(symbol, side, chunk_size, price_limit)
+        except ValueError:
+            chunk_order = None
+        
         # Create progress bar
         with Progress(
             TextColumn("[progress.description]{task.description}"),
@@ -211,7 +221,8 @@ class TWAPOrderManager:
                     
                     # Execute chunk
                     chunk_result = self._execute_chunk(
-                        symbol, side, actual_chunk_size, price_limit, chunk_num + 1
+                        symbol, side, actual_chunk_size, price_limit, chunk_num + 1,
+                        chunk_order if actual_chunk_size == chunk_size else None
                     )
                     
                     # Update TWAP order
@@ -261,17 +272,18 @@ class TWAPOrderManager:
             del self.active_twap_orders[twap_id]
     
     def _execute_chunk(self, symbol: str, side: str, quantity: float, 
-                      price_limit: float = None, chunk_num: int = 1) -> Dict[str, Any]:
+                      price_limit: float = None, chunk_num: int = 1,
+                      validated=None) -> Dict[str, Any]:
         """Execute a single TWAP chunk"""
         try:
             console.print(f"[dim]Executing chunk {chunk_num}: {quantity:.6f} {symbol}[/dim]")
             
             if price_limit:
                 # Use limit order
-                return self.client.place_limit_order(symbol, side, quantity, price_limit)
+                return self.client.place_limit_order(symbol, side, quantity, price_limit, validated)
             else:
                 # Use market order
-                return self.client.place_market_order(symbol, side, quantity)
+                return self.client.place_market_order(symbol, side, quantity, validated)
                 
         except Exception as e:
             logger.log_error(e, f"execute_chunk {chunk_num}")
@@ -394,11 +406,7 @@ def twap_order(symbol: str, side: str, total_quantity: float, duration_minutes:
         python twap.py ETHUSDT SELL 5.0 120 --interval 5 --price-limit 3000
     """
     try:
-        manager = TWAPOrderManager()
-        
-        # Override confirmation if flag is set
-        if no_confirm:
-            manager._confirm_twap_order = lambda *args: True
+        manager = TWAPOrderManager(interactive=not no_confirm)
         
         # Execute TWAP order
         result = manager.execute_twap_order(
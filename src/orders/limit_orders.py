@@ -31,8 +31,12 @@ console = Console()
 class LimitOrderManager:
     """Handles limit order operations"""
     
-    def __init__(self):
-        self.client = BinanceFuturesClient()
+    def __init__(self, interactive: bool = True,
+                 client: Optional[BinanceFuturesClient] = None):
+        # Callers holding a client pass it in so its pooled session is reused
+        self.client = client if client is not None else BinanceFuturesClient()
+        # Non-interactive callers (e.g. the web UI) skip the confirmation prompt
+        self.interactive = interactive
     
     def execute_limit_order(self, symbol: str, side: str, quantity: float, 
                            price: float, wait_for_fill: bool = False) -> Dict[str, Any]:
@@ -68,7 +72,7 @@ class LimitOrderManager:
                 console.print(f"[yellow]{warning_msg}[/yellow]")
             
             # Confirm order
-            if not self._confirm_limit_order(symbol, side, quantity, price, current_price):
+            if self.interactive and not self._confirm_limit_order(symbol, side, quantity, price, current_price):
                 console.print("[red]Order cancelled by user[/red]")
                 return {"status": "CANCELLED", "reason": "User cancelled"}
             
@@ -285,11 +289,7 @@ def limit_order(symbol: str, side: str, quantity: float, price: float, wait: boo
         python limit_orders.py ETHUSDT SELL 0.1 3000 --wait
     """
     try:
-        manager = LimitOrderManager()
-        
-        # Override confirmation if flag is set
-        if no_confirm:
-            manager._confirm_limit_order = lambda *args: True
+        manager = LimitOrderManager(interactive=not no_confirm)
         
         # Execute order
         result = manager.execute_limit_order(symbol.upper(), side.upper(), quantity, price, wait)
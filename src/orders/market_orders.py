@@ -5,7 +5,7 @@ Executes immediate buy/sell orders at current market price
 """
 
 import click
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -29,8 +29,12 @@ console = Console()
 class MarketOrderManager:
     """Handles market order operations"""
     
-    def __init__(self):
-        self.client = BinanceFuturesClient()
+    def __init__(self, interactive: bool = True,
+                 client: Optional[BinanceFuturesClient] = None):
+        # Callers holding a client pass it in so its pooled session is reused
+        self.client = client if client is not None else BinanceFuturesClient()
+        # Non-interactive callers (e.g. the web UI) skip the confirmation prompt
+        self.interactive = interactive
     
     def execute_market_order(self, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
         """Execute a market order"""
@@ -45,7 +49,7 @@ class MarketOrderManager:
             console.print(f"Current Price: [bold]${current_price:,.2f}[/bold]")
             
             # Confirm order
-            if not self._confirm_order(symbol, side, quantity, current_price):
+            if self.interactive and not self._confirm_order(symbol, side, quantity, current_price):
                 console.print("[red]Order cancelled by user[/red]")
                 return {"status": "CANCELLED", "reason": "User cancelled"}
             
@@ -119,11 +123,8 @@ Total Value: ${fill_price * filled_qty:,.2f}
             current_price = self.client.get_current_price(symbol)
             klines = self.client.get_klines(symbol, '1d', 1)
             
-            if klines:
-                open_price = float(klines[0][1])
-                high_price = float(klines[0][2])
-                low_price = float(klines[0][3])
-                volume = float(klines[0][5])
+            if len(klines):
+                open_price, high_price, low_price, _, volume = klines[0, 1:6]
                 
                 change_24h = ((current_price - open_price) / open_price) * 100
                 
@@ -183,17 +184,13 @@ def market_order(symbol: str, side: str, quantity: float, no_confirm: bool, mark
         python market_orders.py ETHUSDT SELL 0.1 --no-confirm
     """
     try:
-        manager = MarketOrderManager()
+        manager = MarketOrderManager(interactive=not no_confirm)
         
         # Show market info if requested
         if market_info:
             manager.display_market_summary(symbol.upper())
             console.print()
         
-        # Override confirmation if flag is set
-        if no_confirm:
-            manager._confirm_order = lambda *args: True
-        
         # Execute order
         result = manager.execute_market_order(symbol.upper(), side.upper(), quantity)
         
@@ -0,0 +1,14 @@
+"""
+Utility functions and configuration
+"""
+
+from .lazy import lazy_exports
+
+# The ``config``/``logger`` instances share their submodule's name, so
+# only the classes are exposed here; import the instances from the
+# submodules directly
+__all__, __getattr__ = lazy_exports(__name__, {
+    "ConfigManager": ".config",
+    "TradingLogger": ".logger",
+    "log_execution_time": ".logger",
+})
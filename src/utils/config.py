@@ -20,6 +20,9 @@ class BinanceConfig:
     api_secret: str
     testnet: bool = True
     base_url: str = "https://testnet.binancefuture.com"
+    keepalive_ping: bool = False
+    use_streams: bool = False
+    price_cache_ttl: float = 0.1  # seconds
 
 @dataclass
 class TradingConfig:
@@ -61,7 +64,10 @@ class ConfigManager:
         return BinanceConfig(
             api_key=api_key,
             api_secret=api_secret,
-            testnet=os.getenv('BINANCE_TESTNET', 'true').lower() == 'true'
+            testnet=os.getenv('BINANCE_TESTNET', 'true').lower() == 'true',
+            keepalive_ping=os.getenv('BINANCE_KEEPALIVE_PING', 'false').lower() == 'true',
+            use_streams=os.getenv('BINANCE_USE_STREAMS', 'false').lower() == 'true',
+            price_cache_ttl=float(os.getenv('BINANCE_PRICE_CACHE_TTL', '0.1'))
         )
     
     def _load_trading_config(self) -> TradingConfig:
@@ -0,0 +1,25 @@
+"""
+Lazy package exports shared by the package __init__ modules
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[List[str], Callable[[str], Any]]:
+    """Build a package's ``__all__`` and module-level ``__getattr__``.
+    
+    exports maps each public name to the submodule (relative to package)
+    that defines it; the submodule is imported on first access and the
+    value cached in the package globals, so later lookups are plain reads.
+    """
+    package_globals = sys.modules[package].__dict__
+    
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        package_globals[name] = value
+        return value
+    
+    return list(exports), __getattr__
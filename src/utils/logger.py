@@ -4,11 +4,17 @@ Logging system for Binance Trading Bot
 Provides structured logging with file rotation and console output
 """
 
+import atexit
+import functools
 import logging
 import logging.handlers
+import os
+import queue
+import random
 import sys
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 
 from .config import config
@@ -51,8 +57,16 @@ class TradingLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Callers only enqueue records; a listener thread does the
+        # formatting and file/console I/O
+        log_queue = queue.Queue(-1)
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
+        
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     def log_order(self, action: str, symbol: str, side: str, 
                   quantity: float, price: Optional[float] = None, 
@@ -103,6 +117,20 @@ class TradingLogger:
         message = f"BALANCE {asset}: {balance} (Available: {available})"
         self.logger.info(message)
     
+    def log_balance_snapshot(self, balances: Iterable[Tuple[str, float, float]]):
+        """Log (asset, balance, available) rows as a single record"""
+        rows = "; ".join(f"{asset}: {balance} (Available: {available})"
+                         for asset, balance, available in balances)
+        if rows:
+            self.logger.info(f"BALANCES {rows}")
+    
+    def log_position_snapshot(self, positions: Iterable[Tuple[str, float, float, float]]):
+        """Log (symbol, amount, unrealized PnL, entry price) rows as a single record"""
+        rows = "; ".join(f"{symbol}: {position_amt} @ {entry_price} (PnL: {unrealized_pnl})"
+                         for symbol, position_amt, unrealized_pnl, entry_price in positions)
+        if rows:
+            self.logger.info(f"POSITIONS {rows}")
+    
     def info(self, message: str):
         """Log info message"""
         self.logger.info(message)
@@ -122,17 +150,45 @@ class TradingLogger:
 # Global logger instance
 logger = TradingLogger()
 
-def log_execution_time(func):
-    """Decorator to log function execution time"""
-    def wrapper(*args, **kwargs):
-        start_time = datetime.now()
-        try:
-            result = func(*args, **kwargs)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"{func.__name__} executed in {execution_time:.3f}s")
+def log_execution_time(func=None, *, threshold_ms: float = 50, sample_rate: float = 0.01):
+    """Decorator to log function execution time.
+    
+    Every call is timed, but only calls slower than threshold_ms, plus a
+    random sample_rate fraction of the rest, are logged. Failures are
+    always logged. Usable bare (@log_execution_time) or with arguments.
+    """
+    def decorator(func):
+        name = func.__name__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = time.perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                execution_time = (time.perf_counter_ns() - start_time) / 1e9
+                logger.log_error(e, f"{name} (failed after {execution_time:.3f}s)")
+                raise
+            elapsed_ms = (time.perf_counter_ns() - start_time) / 1e6
+            if elapsed_ms >= threshold_ms or random.random() < sample_rate:
+                logger.debug(f"{name} executed in {elapsed_ms / 1000:.3f}s")
             return result
-        except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
-            logger.log_error(e, f"{func.__name__} (failed after {execution_time:.3f}s)")
-            raise
-    return wrapper
\ No newline at end of file
+        return wrapper
+    
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+def tail_lines(path: str, count: int, block_size: int = 8192) -> List[str]:
+    """Last `count` lines of a file, reading backwards in blocks from the end"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        # One extra newline so the first kept line is complete
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return data.decode(errors="replace").splitlines()[-count:]
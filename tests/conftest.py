@@ -0,0 +1,10 @@
+"""Shared pytest setup: import modules from src/ the way the bot runs them"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+# config refuses to load without credentials; no test talks to the API
+os.environ.setdefault("BINANCE_API_KEY", "test-key")
+os.environ.setdefault("BINANCE_API_SECRET", "test-secret")
@@ -0,0 +1,698 @@
+"""Order placement, validation and monitoring tests against stub clients"""
+
+import threading
+import time
+
+import pytest
+import requests
+from binance.exceptions import BinanceAPIException
+
+from client import binance_client, validator as validator_module
+from client.binance_client import BinanceFuturesClient
+from client.validator import fast_validate_order, snap_price, snap_quantity, validator
+from orders.advanced import grid as grid_module
+from orders.advanced.grid import GridTradingManager
+from orders.advanced import oco as oco_module
+from orders.advanced.oco import MAX_POLL_BACKOFF, OCOOrderManager, _poll_backoff
+from utils.config import config
+from utils.logger import tail_lines
+
+
+# --- OCO poll backoff -----------------------------------------------------
+
+def _binance_error(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    text = '{"code": -1003, "msg": "Too many requests"}'
+    response._content = text.encode()
+    return BinanceAPIException(response, status_code, text)
+
+
+def test_rate_limit_reaches_caller_as_binance_error():
+    session = requests.Session()
+    BinanceFuturesClient._configure_session(session)
+    retry = session.get_adapter("https://fapi.binance.com").max_retries
+    assert 429 not in retry.status_forcelist
+    assert retry.raise_on_status is False
+    assert retry.respect_retry_after_header is False
+
+
+def test_poll_backoff_honours_retry_after_on_429():
+    delay = _poll_backoff(1, _binance_error(429, {"Retry-After": "120"}))
+    assert delay == 120.0
+
+
+def test_poll_backoff_grows_and_caps():
+    error = _binance_error(500)
+    delays = [_poll_backoff(failures, error) for failures in range(1, 6)]
+    assert 10 <= delays[0] < 11
+    assert 20 <= delays[1] < 21
+    assert all(MAX_POLL_BACKOFF <= delay < MAX_POLL_BACKOFF + 1 for delay in delays[3:])
+
+
+# --- OCO monitoring ----------------------------------------------------------
+
+class StubOCOClient:
+    """Client stand-in for one streamed OCO: order 1 is the limit leg, 2 the stop"""
+    
+    def __init__(self):
+        self.open_ids = {1, 2}
+        self.filled_ids = set()
+        self.cancelled = []
+        self.listeners = []
+    
+    def add_order_listener(self, callback):
+        self.listeners.append(callback)
+        return True
+    
+    def remove_order_listener(self, callback):
+        self.listeners.remove(callback)
+    
+    def get_open_orders(self, symbol):
+        return [{"orderId": order_id} for order_id in self.open_ids]
+    
+    def get_order_status(self, symbol, order_id):
+        return {"status": "FILLED" if order_id in self.filled_ids else "CANCELED"}
+    
+    def cancel_order(self, symbol, order_id):
+        self.open_ids.discard(order_id)
+        self.cancelled.append(order_id)
+    
+    def fill(self, order_id):
+        self.open_ids.discard(order_id)
+        self.filled_ids.add(order_id)
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def oco_manager(monkeypatch):
+    monkeypatch.setattr(oco_module, "OCO_POLL_INTERVAL", 0.02)
+    monkeypatch.setattr(oco_module, "OCO_STREAM_CHECK_INTERVAL", 0.05)
+    manager = OCOOrderManager(interactive=False, client=StubOCOClient())
+    yield manager
+    manager.stop_monitoring.set()
+
+
+def _start_oco(manager):
+    oco_result = {
+        "oco_id": "OCO_TEST", "symbol": "BTCUSDT",
+        "limit_order": {"orderId": 1}, "stop_order": {"orderId": 2},
+        "status": "ACTIVE",
+    }
+    manager._start_oco_monitoring(oco_result)
+    return oco_result
+
+
+def test_streamed_oco_fill_missed_by_the_stream_is_found_by_the_poll(oco_manager):
+    stub = oco_manager.client
+    oco_result = _start_oco(oco_manager)
+    assert "order_listener" in oco_result
+    
+    # The limit leg fills while the socket is down: no event is delivered
+    stub.fill(1)
+    
+    assert _wait_for(lambda: not oco_manager.monitoring_orders)
+    assert oco_result["status"] == "LIMIT_FILLED"
+    assert stub.cancelled == [2]
+    assert stub.listeners == []
+
+
+def test_stream_error_rechecks_the_oco(oco_manager, monkeypatch):
+    monkeypatch.setattr(oco_module, "OCO_STREAM_CHECK_INTERVAL", 60)
+    stub = oco_manager.client
+    oco_result = _start_oco(oco_manager)
+    
+    stub.fill(2)
+    stub.listeners[0](None)
+    
+    assert _wait_for(lambda: not oco_manager.monitoring_orders)
+    assert oco_result["status"] == "STOP_FILLED"
+    assert stub.cancelled == [1]
+
+
+def test_streamed_fill_cancels_off_the_websocket_thread(oco_manager):
+    stub = oco_manager.client
+    oco_result = _start_oco(oco_manager)
+    cancel_threads = []
+    stub.cancel_order = lambda symbol, order_id: cancel_threads.append(threading.current_thread())
+    
+    stub.listeners[0]({"X": "FILLED", "i": 1})
+    
+    assert _wait_for(lambda: cancel_threads)
+    assert cancel_threads[0] is not threading.current_thread()
+    assert oco_result["status"] == "LIMIT_FILLED"
+
+
+# --- Tick/step snapping and fast validation -------------------------------
+
+
+@pytest.fixture
+def precision(monkeypatch):
+    """Pin the configured fallback precisions (config.json may override them)"""
+    monkeypatch.setattr(config.trading, "price_precision", 2)
+    monkeypatch.setattr(config.trading, "quantity_precision", 3)
+
+
+@pytest.fixture
+def filtered_symbol(monkeypatch):
+    """A symbol with registered exchange filters: tick 0.10, lot step 0.001"""
+    monkeypatch.setitem(validator_module._SYMBOL_FILTERS, "SNAPUSDT", None)
+    validator_module.register_symbol_filters("SNAPUSDT", "0.10", "0.001")
+    return "SNAPUSDT"
+
+
+def test_snap_without_filters_rounds_half_up_to_config_precision(precision):
+    assert snap_quantity(0.0012345) == 0.001
+    assert snap_quantity(0.0015) == 0.002
+    # round(3.045, 2) gives 3.04 on binary floats
+    assert snap_price(3.045) == 3.05
+
+
+def test_snap_with_filters_uses_tick_and_lot_step(precision, filtered_symbol):
+    assert snap_quantity(0.0012345, filtered_symbol) == 0.001
+    # Quantities never round up past what was asked for
+    assert snap_quantity(0.0019, filtered_symbol) == 0.001
+    assert snap_price(100.06, filtered_symbol) == 100.1
+    assert snap_price(100.04, filtered_symbol) == 100.0
+
+
+def test_fast_validate_order_snaps_and_infers_type(precision, filtered_symbol):
+    order = fast_validate_order("snapusdt", "buy", 0.0019, 100.06)
+    assert (order.symbol, order.side, order.quantity, order.price, order.order_type) == (
+        "SNAPUSDT", "BUY", 0.001, 100.1, "LIMIT"
+    )
+    assert fast_validate_order("SNAPUSDT", "SELL", 0.002).order_type == "MARKET"
+
+
+@pytest.mark.parametrize("symbol, side, quantity, price, message", [
+    ("BTC", "BUY", 0.01, None, "at least 6 characters"),
+    ("BTC-USDT", "BUY", 0.01, None, "only uppercase letters"),
+    ("BTCUSDT", "HOLD", 0.01, None, "Side must be one of"),
+    ("BTCUSDT", "BUY", 0, None, "must be positive"),
+    ("BTCUSDT", "BUY", 0.0001, None, "at least"),
+    ("BTCUSDT", "BUY", 1000, None, "cannot exceed"),
+    ("BTCUSDT", "BUY", 0.01, -1.0, "Price must be positive"),
+])
+def test_fast_validate_order_rejects(precision, symbol, side, quantity, price, message):
+    with pytest.raises(ValueError, match=message):
+        fast_validate_order(symbol, side, quantity, price)
+
+
+def test_fast_validate_order_rejects_quantity_below_lot_step(monkeypatch):
+    monkeypatch.setitem(validator_module._SYMBOL_FILTERS, "LOTSUSDT", None)
+    validator_module.register_symbol_filters("LOTSUSDT", "0.1", "1")
+    with pytest.raises(ValueError, match="lot step"):
+        fast_validate_order("LOTSUSDT", "BUY", 0.5)
+
+
+def test_validate_batch_orders_rejects_empty_and_bad_legs(precision):
+    with pytest.raises(ValueError, match="at least one order"):
+        validator.validate_batch_orders([])
+    with pytest.raises(ValueError, match="Side must be one of"):
+        validator.validate_batch_orders([
+            {"symbol": "BTCUSDT", "side": "BUY", "quantity": 0.01},
+            {"symbol": "BTCUSDT", "side": "HOLD", "quantity": 0.01},
+        ])
+    with pytest.raises(ValueError, match="at least 6 characters"):
+        validator.validate_batch_orders([{"side": "BUY", "quantity": 0.01}])
+
+
+# --- Client construction ---------------------------------------------------
+
+class StubWebsocketManager:
+    """ThreadedWebsocketManager stand-in that opens no sockets"""
+    
+    def __init__(self, **kwargs):
+        pass
+    
+    def start(self):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def start_futures_user_socket(self, callback):
+        pass
+    
+    def start_individual_symbol_ticker_futures_socket(self, callback, symbol):
+        pass
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """Build a real BinanceFuturesClient around a python-binance stub.
+    
+    Streams are off unless streams=True, which wires in StubWebsocketManager;
+    the keepalive pinger is always off.
+    """
+    monkeypatch.setattr(config.binance, "keepalive_ping", False)
+    clients = []
+    
+    def make(stub, streams=False):
+        stub.session = requests.Session()
+        
+        class StubbedClient(binance_client.Client):
+            def __new__(cls, **kwargs):
+                return stub
+        
+        monkeypatch.setattr(binance_client, "Client", StubbedClient)
+        monkeypatch.setattr(binance_client, "ThreadedWebsocketManager", StubWebsocketManager)
+        monkeypatch.setattr(config.binance, "use_streams", streams)
+        client = BinanceFuturesClient()
+        clients.append(client)
+        return client
+    
+    yield make
+    for client in clients:
+        client.close()
+
+
+# --- Batch order submission ------------------------------------------------
+
+class StubBatchClient:
+    """python-binance stand-in recording each batchOrders request"""
+    
+    def __init__(self, reject=()):
+        self.requests = []
+        self.reject = set(reject)
+        self.next_id = 0
+    
+    def futures_place_batch_order(self, batchOrders):
+        self.requests.append(batchOrders)
+        results = []
+        for leg in batchOrders:
+            self.next_id += 1
+            if self.next_id in self.reject:
+                results.append({"code": -2019, "msg": "Margin is insufficient."})
+            else:
+                results.append({"orderId": self.next_id, "status": "NEW", "symbol": leg["symbol"]})
+        return results
+
+
+def test_place_batch_orders_chunks_by_five(precision, make_client):
+    stub = StubBatchClient()
+    orders = [{"symbol": "BTCUSDT", "side": "BUY", "quantity": 0.01, "price": 100.0 + i}
+              for i in range(12)]
+    
+    results = make_client(stub).place_batch_orders(orders)
+    
+    assert [len(request) for request in stub.requests] == [5, 5, 2]
+    assert [result["orderId"] for result in results] == list(range(1, 13))
+    assert stub.requests[0][0]["type"] == "LIMIT"
+    assert stub.requests[0][0]["timeInForce"] == "GTC"
+
+
+def test_place_batch_orders_keeps_rejected_legs_in_place(precision, make_client):
+    stub = StubBatchClient(reject={2, 6})
+    orders = [{"symbol": "BTCUSDT", "side": "SELL", "quantity": 0.01}] * 7
+    
+    results = make_client(stub).place_batch_orders(orders)
+    
+    assert len(results) == 7
+    assert [i for i, result in enumerate(results, 1) if "code" in result] == [2, 6]
+    assert results[1] == {"code": -2019, "msg": "Margin is insufficient."}
+    assert stub.requests[0][0]["type"] == "MARKET"
+
+
+# --- Log tail ----------------------------------------------------------------
+
+def test_tail_lines_file_smaller_than_block(tmp_path):
+    log = tmp_path / "bot.log"
+    log.write_text("one\ntwo\nthree\n")
+    assert tail_lines(str(log), 2) == ["two", "three"]
+    assert tail_lines(str(log), 10) == ["one", "two", "three"]
+
+
+def test_tail_lines_without_trailing_newline(tmp_path):
+    log = tmp_path / "bot.log"
+    log.write_text("one\ntwo\nthree")
+    assert tail_lines(str(log), 2) == ["two", "three"]
+    assert tail_lines(str(log), 1) == ["three"]
+
+
+def test_tail_lines_across_block_boundaries(tmp_path):
+    log = tmp_path / "bot.log"
+    lines = [f"line {i:03d}" for i in range(200)]
+    log.write_text("\n".join(lines) + "\n")
+    assert tail_lines(str(log), 10, block_size=16) == lines[-10:]
+
+
+def test_tail_lines_empty_file(tmp_path):
+    log = tmp_path / "bot.log"
+    log.write_text("")
+    assert tail_lines(str(log), 10) == []
+
+
+# --- Grid profit pairing -----------------------------------------------------
+
+@pytest.fixture
+def grid_manager():
+    return GridTradingManager(interactive=False, client=object())
+
+
+def _grid():
+    return {'open_buys': {}, 'total_profit': 0.0}
+
+
+def test_grid_profit_pairs_sell_with_buy_one_level_below(grid_manager):
+    grid = _grid()
+    grid_manager._calculate_grid_profit(grid, 2, 'BUY', 100.0, 0.5)
+    grid_manager._calculate_grid_profit(grid, 3, 'SELL', 104.0, 0.5)
+    assert grid['total_profit'] == pytest.approx(2.0)
+    assert grid['open_buys'] == {}
+
+
+def test_grid_profit_falls_back_to_nearest_open_buy_below(grid_manager):
+    grid = _grid()
+    grid_manager._calculate_grid_profit(grid, 1, 'BUY', 96.0, 1.0)
+    grid_manager._calculate_grid_profit(grid, 2, 'BUY', 98.0, 1.0)
+    grid_manager._calculate_grid_profit(grid, 5, 'SELL', 106.0, 1.0)
+    assert grid['total_profit'] == pytest.approx(8.0)
+    assert grid['open_buys'] == {1: (96.0, 1.0)}
+
+
+def test_grid_profit_counts_each_buy_once(grid_manager):
+    grid = _grid()
+    grid_manager._calculate_grid_profit(grid, 2, 'BUY', 100.0, 1.0)
+    grid_manager._calculate_grid_profit(grid, 3, 'SELL', 102.0, 1.0)
+    grid_manager._calculate_grid_profit(grid, 3, 'SELL', 102.0, 1.0)
+    assert grid['total_profit'] == pytest.approx(2.0)
+
+
+def test_grid_profit_ignores_sell_without_lower_buy(grid_manager):
+    grid = _grid()
+    grid_manager._calculate_grid_profit(grid, 4, 'BUY', 104.0, 1.0)
+    grid_manager._calculate_grid_profit(grid, 3, 'SELL', 103.0, 1.0)
+    assert grid['total_profit'] == 0.0
+    assert grid['open_buys'] == {4: (104.0, 1.0)}
+
+
+def test_grid_profit_uses_the_smaller_fill_quantity(grid_manager):
+    grid = _grid()
+    grid_manager._calculate_grid_profit(grid, 1, 'BUY', 100.0, 0.3)
+    grid_manager._calculate_grid_profit(grid, 2, 'SELL', 110.0, 0.5)
+    assert grid['total_profit'] == pytest.approx(3.0)
+
+
+class YieldingDict(dict):
+    """dict whose iteration hands the GIL over between keys, so a scan of
+    it interleaves with other threads"""
+    
+    def __iter__(self):
+        for key in list(super().__iter__()):
+            time.sleep(0)
+            yield key
+
+
+def test_grid_fills_from_two_threads_pair_each_buy_once(grid_manager, monkeypatch):
+    # Counter orders aren't under test here
+    monkeypatch.setattr(grid_manager, "_place_counter_order", lambda *args: None)
+    buys, sell_level = 50, 100
+    grid = {
+        'open_buys': YieldingDict({level: (100.0, 1.0) for level in range(1, buys + 1)}),
+        'total_profit': 0.0,
+        'buy_orders': {}, 'sell_orders': {sell_level: {}},
+        'open_order_ids': set(range(buys)),
+        'trades': {'level': [], 'side': [], 'quantity': [], 'price': [], 'time_ns': [], 'order_id': []},
+    }
+    # Every sell falls back to the nearest open buy below it, so both
+    # threads contend for the same max(lower_levels)
+    start = threading.Barrier(2)
+    errors = []
+    
+    def report_sells(order_ids):
+        start.wait()
+        try:
+            for order_id in order_ids:
+                grid_manager._handle_grid_order_fill(grid, sell_level, 'SELL', {
+                    'orderId': order_id, 'status': 'FILLED', 'avgPrice': '101', 'executedQty': '1'
+                })
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=report_sells, args=(range(i, buys, 2),)) for i in (0, 1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    assert grid['open_buys'] == {}
+    assert grid['total_profit'] == pytest.approx(buys * 1.0)
+
+
+# --- Grid monitoring ---------------------------------------------------------
+
+class StubGridClient:
+    """Client stand-in for a streamed grid on BTCUSDT with a 0.1 tick"""
+    
+    def __init__(self):
+        self.tick_size = "0.1"
+        self.open_orders = {}
+        self.filled = {}
+        self.batches = []
+        self.cancelled = []
+        self.listeners = []
+        self.next_id = 0
+    
+    def add_order_listener(self, callback):
+        self.listeners.append(callback)
+        return True
+    
+    def remove_order_listener(self, callback):
+        self.listeners.remove(callback)
+    
+    def get_current_price(self, symbol):
+        return 100.0
+    
+    def get_symbol_info(self, symbol):
+        return {"filters": [{"filterType": "PRICE_FILTER", "tickSize": self.tick_size}]}
+    
+    def place_batch_orders(self, orders):
+        self.batches.append(orders)
+        results = []
+        for order in orders:
+            self.next_id += 1
+            self.open_orders[self.next_id] = order
+            results.append({"orderId": self.next_id, "status": "NEW"})
+        return results
+    
+    def get_open_orders(self, symbol):
+        return [{"orderId": order_id} for order_id in list(self.open_orders)]
+    
+    def get_order_status(self, symbol, order_id):
+        if order_id in self.filled:
+            order = self.filled[order_id]
+            return {"orderId": order_id, "status": "FILLED",
+                    "avgPrice": order["price"], "executedQty": order["quantity"]}
+        return {"orderId": order_id, "status": "CANCELED"}
+    
+    def cancel_order(self, symbol, order_id):
+        self.open_orders.pop(order_id, None)
+        self.cancelled.append(order_id)
+    
+    def fill(self, order_id):
+        self.filled[order_id] = self.open_orders.pop(order_id)
+
+
+@pytest.fixture
+def streamed_grid_manager(monkeypatch):
+    monkeypatch.setattr(grid_module, "GRID_STREAM_CHECK_INTERVAL", 0.05)
+    manager = GridTradingManager(interactive=False, client=StubGridClient())
+    yield manager
+    manager.stop_monitoring.set()
+    for grid in manager.active_grids.values():
+        grid['stop_event'].set()
+
+
+def _start_grid(manager):
+    # Levels 90, 95, 100, 105, 110 around a market price of 100: orders
+    # 1 and 2 buy at levels 1 and 2, orders 3 and 4 sell at levels 4 and 5
+    return manager.execute_grid_strategy("BTCUSDT", 0.01, 5, 90.0, 110.0)
+
+
+def test_streamed_grid_fill_missed_by_the_stream_is_found_by_the_poll(streamed_grid_manager):
+    stub = streamed_grid_manager.client
+    grid = _start_grid(streamed_grid_manager)
+    assert "order_listener" in grid
+    
+    # The level 2 buy fills while the socket is down: no event is delivered
+    stub.fill(2)
+    
+    assert _wait_for(lambda: len(stub.batches) == 2)
+    assert grid['trades']['level'] == [2]
+    assert stub.batches[1] == [{"symbol": "BTCUSDT", "side": "SELL", "quantity": 0.01, "price": 100.0}]
+
+
+def test_grid_levels_follow_a_tick_change():
+    stub = StubGridClient()
+    manager = GridTradingManager(interactive=False, client=stub)
+    levels = manager._calculate_grid_levels("BTCUSDT", 100.0, 100.3, 2, 100.0)
+    assert [level.price for level in levels] == [100.0, 100.3]
+    
+    # Served from the client's symbol info, so a refreshed tick applies at once
+    stub.tick_size = "0.5"
+    levels = manager._calculate_grid_levels("BTCUSDT", 100.0, 100.3, 2, 100.0)
+    assert [level.price for level in levels] == [100.0, 100.5]
+
+
+def _fill_event(order_id, price):
+    return {"X": "FILLED", "i": order_id, "ap": str(price), "z": "0.01"}
+
+
+def test_counter_orders_for_fills_in_one_window_share_a_batch(streamed_grid_manager, monkeypatch):
+    monkeypatch.setattr(grid_module, "GRID_STREAM_CHECK_INTERVAL", 60)
+    stub = streamed_grid_manager.client
+    _start_grid(streamed_grid_manager)
+    
+    for order_id, price in ((1, 90.0), (2, 95.0)):
+        stub.fill(order_id)
+        stub.listeners[0](_fill_event(order_id, price))
+    
+    assert _wait_for(lambda: len(stub.batches) == 2)
+    assert stub.batches[1] == [
+        {"symbol": "BTCUSDT", "side": "SELL", "quantity": 0.01, "price": 95.0},
+        {"symbol": "BTCUSDT", "side": "SELL", "quantity": 0.01, "price": 100.0},
+    ]
+
+
+def test_stop_cancels_a_counter_order_placed_while_stopping(streamed_grid_manager, monkeypatch):
+    monkeypatch.setattr(grid_module, "GRID_STREAM_CHECK_INTERVAL", 60)
+    manager = streamed_grid_manager
+    stub = manager.client
+    grid = _start_grid(manager)
+    
+    # The grid is stopped while the counter order's batch is in flight
+    place_batch_orders = stub.place_batch_orders
+    
+    def place_while_stopping(orders):
+        results = place_batch_orders(orders)
+        manager.stop_grid_strategy(grid['grid_id'])
+        return results
+    
+    monkeypatch.setattr(stub, "place_batch_orders", place_while_stopping)
+    stub.fill(1)
+    stub.listeners[0](_fill_event(1, 90.0))
+    
+    assert _wait_for(lambda: 5 in stub.cancelled)
+    assert sorted(stub.cancelled) == [2, 3, 4, 5]
+    assert grid['open_order_ids'] == set()
+    assert stub.open_orders == {}
+    # With no active grid left, the drain thread exits once idle
+    assert _wait_for(lambda: manager._counter_thread is None, timeout=3.0)
+
+
+# --- Streamed prices ---------------------------------------------------------
+
+class StubTickerClient:
+    def __init__(self, price):
+        self.price = price
+        self.calls = 0
+    
+    def futures_symbol_ticker(self, symbol):
+        self.calls += 1
+        return {"symbol": symbol, "price": str(self.price)}
+
+
+def test_fresh_streamed_price_skips_rest(make_client):
+    stub = StubTickerClient(99.0)
+    client = make_client(stub, streams=True)
+    client._on_ticker({"e": "24hrTicker", "s": "BTCUSDT", "c": "101.5"})
+    assert client.get_current_price("BTCUSDT") == 101.5
+    assert stub.calls == 0
+
+
+def test_stale_streamed_price_falls_back_to_rest(monkeypatch, make_client):
+    stub = StubTickerClient(99.0)
+    client = make_client(stub, streams=True)
+    client._on_ticker({"e": "24hrTicker", "s": "BTCUSDT", "c": "101.5"})
+    
+    received_at = client._price_cache["BTCUSDT"][0]
+    monkeypatch.setattr(binance_client.time, "monotonic",
+                        lambda: received_at + binance_client.STREAM_PRICE_MAX_AGE + 1)
+    assert client.get_current_price("BTCUSDT") == 99.0
+    assert stub.calls == 1
+
+
+# --- Open orders -------------------------------------------------------------
+
+class StubOpenOrdersClient:
+    def __init__(self, orders):
+        self.orders = orders
+        self.requests = []
+    
+    def futures_get_open_orders(self, **params):
+        self.requests.append(params)
+        symbol = params.get("symbol")
+        return [order for order in self.orders if symbol is None or order["symbol"] == symbol]
+
+
+OPEN_ORDERS = [{"orderId": 1, "symbol": "BTCUSDT"}, {"orderId": 2, "symbol": "ETHUSDT"}]
+
+
+def test_symbol_scoped_open_orders_use_the_per_symbol_request(make_client):
+    stub = StubOpenOrdersClient(OPEN_ORDERS)
+    client = make_client(stub)
+    assert client.get_open_orders("BTCUSDT") == [OPEN_ORDERS[0]]
+    assert client.get_open_orders("ETHUSDT") == [OPEN_ORDERS[1]]
+    assert stub.requests == [{"symbol": "BTCUSDT"}, {"symbol": "ETHUSDT"}]
+
+
+def test_all_symbols_snapshot_is_shared_while_fresh(make_client):
+    stub = StubOpenOrdersClient(OPEN_ORDERS)
+    client = make_client(stub)
+    assert client.get_open_orders() == OPEN_ORDERS
+    assert client.get_open_orders("ETHUSDT") == [OPEN_ORDERS[1]]
+    assert client.get_open_orders() == OPEN_ORDERS
+    assert stub.requests == [{}]
+
+
+# --- Symbol metadata -------------------------------------------------------
+
+class StubExchangeInfoClient:
+    def __init__(self, tick_size):
+        self.tick_size = tick_size
+        self.calls = 0
+    
+    def futures_exchange_info(self):
+        self.calls += 1
+        return {"symbols": [{
+            "symbol": "METAUSDT",
+            "status": "TRADING",
+            "pricePrecision": 2,
+            "quantityPrecision": 3,
+            "filters": [
+                {"filterType": "PRICE_FILTER", "tickSize": self.tick_size},
+                {"filterType": "LOT_SIZE", "stepSize": "0.001"},
+                {"filterType": "MIN_NOTIONAL", "notional": "5"},
+            ],
+        }]}
+
+
+def test_symbol_meta_follows_the_filters_ttl(monkeypatch, make_client):
+    monkeypatch.setitem(validator_module._SYMBOL_FILTERS, "METAUSDT", None)
+    stub = StubExchangeInfoClient("0.10")
+    client = make_client(stub)
+    
+    meta = client._get_symbol_meta("METAUSDT")
+    assert meta.min_notional == 5.0
+    assert client._get_symbol_meta("METAUSDT") is meta
+    assert snap_price(100.04, "METAUSDT") == 100.0
+    assert stub.calls == 1
+    
+    # The exchange changes the tick; it is picked up once the filters expire
+    stub.tick_size = "0.01"
+    later = time.monotonic() + binance_client.SYMBOL_INFO_TTLS['filters'] + 1
+    monkeypatch.setattr(binance_client.time, "monotonic", lambda: later)
+    client._get_symbol_meta("METAUSDT")
+    assert stub.calls == 2
+    assert snap_price(100.04, "METAUSDT") == 100.04